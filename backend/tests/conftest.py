@@ -0,0 +1,93 @@
+"""Shared pytest fixtures."""
+
+import asyncio
+from collections.abc import Callable, Coroutine, Iterator
+from typing import Any
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from wsim_api import store as store_module
+from wsim_api.main import app
+from wsim_api.store import GameStore, get_game_store
+from wsim_core.models.game import Game
+
+from .game_driver import GameDriver
+from .helpers import ORJSONTestClient, store_scenario_game
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_game_store() -> Iterator[GameStore]:
+    """Give each test process (and so each xdist worker) its own in-memory game store.
+
+    This ignores WSIM_ENABLE_PERSISTENCE, so parallel workers never share a save
+    directory or clear each other's games.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        game_store = GameStore()
+        mp.setattr(store_module, "_game_store", game_store)
+        yield game_store
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """Share one TestClient (and one app startup) across the test session."""
+    with ORJSONTestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def scenarios_list(client: TestClient) -> list[dict]:
+    """Fetch the bundled scenario listing once per session."""
+    response = client.get("/games/scenarios")
+    assert response.status_code == 200
+    return response.json()
+
+
+@pytest.fixture
+def reset_game_store() -> None:
+    """Empty the global game store before a test."""
+    get_game_store().clear()
+
+
+@pytest.fixture(scope="session")
+def async_runner() -> Iterator[asyncio.Runner]:
+    """Share one event loop for tests that await router handlers directly."""
+    with asyncio.Runner() as runner:
+        yield runner
+
+
+@pytest.fixture
+def fresh_game() -> Callable[[str], Game]:
+    """Factory storing a new game forked from a cached scenario template."""
+    return store_scenario_game
+
+
+@pytest.fixture
+def game_driver(
+    async_runner: asyncio.Runner, fresh_game: Callable[[str], Game]
+) -> Callable[[str], GameDriver]:
+    """Factory creating a GameDriver for a fresh scenario game, bypassing HTTP."""
+
+    def make(scenario_id: str) -> GameDriver:
+        return GameDriver(async_runner, fresh_game(scenario_id))
+
+    return make
+
+
+@pytest.fixture
+def handler_error(async_runner: asyncio.Runner) -> Callable[[Coroutine[Any, Any, Any], int], str]:
+    """Await a router handler that must fail and return its error detail.
+
+    For error paths raised by the handler itself (not request validation), this
+    skips the ASGI stack entirely.
+    """
+
+    def check(coro: Coroutine[Any, Any, Any], status_code: int) -> str:
+        with pytest.raises(HTTPException) as exc_info:
+            async_runner.run(coro)
+        assert exc_info.value.status_code == status_code
+        return str(exc_info.value.detail)
+
+    return check
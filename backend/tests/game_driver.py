@@ -0,0 +1,146 @@
+"""In-process game driver for tests that exercise game logic rather than routing.
+
+The router handlers take plain arguments and read games from the global store,
+so they can be awaited directly. This skips the ASGI stack and the JSON
+encode/decode round trip of every TestClient request.
+"""
+
+import asyncio
+from typing import Any
+
+from wsim_api.routers import games
+from wsim_api.store import get_game_store
+from wsim_core.models.game import Game
+from wsim_core.models.orders import ShipOrders
+
+from .helpers import split_ships
+
+# Driver input is trusted, so request models are built with model_construct
+# (no validation) from templates created once at import.
+_ORDERS_TEMPLATE = games.SubmitOrdersRequest.model_construct(side="P1", orders=[])
+_READY_REQUESTS = tuple(games.MarkReadyRequest.model_construct(side=s) for s in ("P1", "P2"))
+
+
+def _orders_request(side: str, orders: list[dict]) -> games.SubmitOrdersRequest:
+    """Build a submit-orders request from trusted order dicts without validation."""
+    ship_orders = [ShipOrders.model_construct(**o) for o in orders]
+    return _ORDERS_TEMPLATE.model_copy(update={"side": side, "orders": ship_orders})
+
+
+class GameDriver:
+    """Drive a single game through the turn sequence without HTTP.
+
+    All calls act on the game's current turn number. States and events are
+    returned as JSON-mode dicts so assertions match the API's wire format.
+    States returned by turn actions omit the event log (``include_log=False``);
+    use the returned events, or ``state()`` for the full log.
+    """
+
+    def __init__(self, runner: asyncio.Runner, game: Game) -> None:
+        """Wrap a game that is already in the store.
+
+        Args:
+            runner: Event loop runner used to await the router handlers
+            game: Stored game to drive
+        """
+        self._runner = runner
+        self.game_id = game.id
+        self.initial_state = game.model_dump(mode="json")
+
+    def _run(self, coro: Any) -> Any:
+        return self._runner.run(coro)
+
+    @property
+    def turn(self) -> int:
+        """Current turn number of the game."""
+        return get_game_store().get_game(self.game_id).turn_number
+
+    def state(self) -> dict:
+        """Get the current game state."""
+        return get_game_store().get_game(self.game_id).model_dump(mode="json")
+
+    def uniform_orders(self, movement_string: str) -> tuple[list[dict], list[dict]]:
+        """Give every ship the same movement.
+
+        Args:
+            movement_string: Movement notation applied to all ships
+
+        Returns:
+            Tuple of (P1 orders, P2 orders), ready to pass to ``plan`` or ``run_turn``
+        """
+        p1_ships, p2_ships = split_ships(self.initial_state["ships"])
+        return (
+            [{"ship_id": s["id"], "movement_string": movement_string} for s in p1_ships],
+            [{"ship_id": s["id"], "movement_string": movement_string} for s in p2_ships],
+        )
+
+    def plan(self, p1_orders: list[dict], p2_orders: list[dict]) -> None:
+        """Submit both sides' orders and mark both ready in one event-loop run.
+
+        Args:
+            p1_orders: P1 ship orders as dicts with ship_id and movement_string
+            p2_orders: P2 ship orders as dicts with ship_id and movement_string
+        """
+        turn = self.turn
+
+        async def submit_and_ready() -> None:
+            for side, orders in (("P1", p1_orders), ("P2", p2_orders)):
+                request = _orders_request(side, orders)
+                await games.submit_orders(self.game_id, turn, request, include_log=False)
+            for ready_request in _READY_REQUESTS:
+                await games.mark_ready(self.game_id, turn, ready_request, include_log=False)
+
+        self._run(submit_and_ready())
+
+    def resolve_movement(self) -> tuple[dict, list[dict]]:
+        """Resolve movement for the current turn.
+
+        Returns:
+            Tuple of (game state, movement events)
+        """
+        response = self._run(games.resolve_movement(self.game_id, self.turn, include_log=False))
+        dumped = response.model_dump(mode="json")
+        return dumped["state"], dumped["events"]
+
+    def all_arcs(self) -> dict[str, dict[str, dict]]:
+        """Get arc info for both broadsides of every ship, keyed by ship ID then L/R."""
+        response = self._run(games.get_all_broadside_arcs(self.game_id))
+        return response.model_dump(mode="json")["arcs"]
+
+    def resolve_reload(self) -> tuple[dict, list[dict]]:
+        """Resolve the reload phase for the current turn.
+
+        Returns:
+            Tuple of (game state, reload events)
+        """
+        response = self._run(games.resolve_reload(self.game_id, self.turn, include_log=False))
+        dumped = response.model_dump(mode="json")
+        return dumped["state"], dumped["events"]
+
+    def advance(self) -> dict:
+        """Advance to the next turn.
+
+        Returns:
+            Game state for the new turn
+        """
+        response = self._run(games.advance_turn(self.game_id, self.turn, include_log=False))
+        return response.state.model_dump(mode="json")
+
+    def run_turn(self, p1_orders: list[dict], p2_orders: list[dict]) -> tuple[dict, list[dict]]:
+        """Play a full turn without combat: orders, ready, movement, reload, advance.
+
+        The turn is not advanced if the game ends during reload.
+
+        Args:
+            p1_orders: P1 ship orders as dicts with ship_id and movement_string
+            p2_orders: P2 ship orders as dicts with ship_id and movement_string
+
+        Returns:
+            Tuple of (final game state, movement and reload events for the turn)
+        """
+        self.plan(p1_orders, p2_orders)
+        _, movement_events = self.resolve_movement()
+        state, reload_events = self.resolve_reload()
+        if not state["game_ended"]:
+            state = self.advance()
+        return state, movement_events + reload_events
@@ -0,0 +1,157 @@
+"""Shared helpers for API-level tests."""
+
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import cache
+from typing import Any
+
+import httpx
+import orjson
+from fastapi.testclient import TestClient
+
+from wsim_api.routers.games import SCENARIOS_DIR
+from wsim_api.store import get_game_store
+from wsim_core.models.game import Game
+from wsim_core.serialization.scenario_loader import (
+    initialize_game_from_scenario,
+    load_scenario_from_file,
+)
+
+SCENARIO_IDS = ("mvp_frigate_duel_v1", "mvp_crossing_paths_v1", "mvp_two_ship_line_battle_v1")
+
+
+class ORJSONTestClient(TestClient):
+    """TestClient that encodes ``json=`` request bodies with orjson.
+
+    Tests can keep passing ``json=...`` while skipping the stdlib encoder.
+    """
+
+    def request(self, method: str, url: Any, *, json: Any = None, **kwargs: Any) -> httpx.Response:
+        """Send a request, pre-encoding any JSON body with orjson."""
+        if json is not None:
+            kwargs["content"] = orjson.dumps(json)
+            kwargs["headers"] = {
+                **dict(kwargs.get("headers") or {}),
+                "content-type": "application/json",
+            }
+        return super().request(method, url, **kwargs)
+
+
+def error_detail(response: httpx.Response, status_code: int) -> str:
+    """Check an error response's status code and return its ``detail`` message.
+
+    The body is decoded once with orjson, however many substrings are then checked.
+
+    Args:
+        response: Response expected to carry an HTTPException error body
+        status_code: Expected HTTP status code
+
+    Returns:
+        The error detail string
+    """
+    assert response.status_code == status_code, response.content
+    return orjson.loads(response.content)["detail"]
+
+
+@cache
+def scenario_template(scenario_id: str) -> Game:
+    """Build a scenario's initial game state once per process.
+
+    Treat the result as read-only; use ``store_scenario_game`` to get a game to mutate.
+
+    Args:
+        scenario_id: Bundled scenario identifier
+
+    Returns:
+        Initialized game with the placeholder ID ``"template"``
+    """
+    scenario = load_scenario_from_file(SCENARIOS_DIR / f"{scenario_id}.json")
+    return initialize_game_from_scenario(scenario, "template")
+
+
+@cache
+def ship_ids_by_side(scenario_id: str) -> dict[str, tuple[str, ...]]:
+    """Get a scenario's ship IDs per side, in game order.
+
+    Ship rosters are fixed by the scenario, so this is computed once per scenario.
+
+    Args:
+        scenario_id: Bundled scenario identifier
+
+    Returns:
+        Mapping of side to that side's ship IDs, with P1 first and then P2, so
+        ``p1_ids, p2_ids = ship_ids_by_side(...).values()`` unpacks in side order
+    """
+    ships = scenario_template(scenario_id).ships.values()
+    return {side: tuple(ship.id for ship in ships if ship.side == side) for side in ("P1", "P2")}
+
+
+def store_scenario_game(scenario_id: str) -> Game:
+    """Fork a scenario template under a new ID and add it to the global game store.
+
+    This gives the same state as ``POST /games`` without the HTTP round trip
+    or reloading the scenario file.
+
+    Args:
+        scenario_id: Bundled scenario identifier
+
+    Returns:
+        The stored game
+    """
+    store = get_game_store()
+    game = scenario_template(scenario_id).fork(store.generate_game_id())
+    store.create_game(game)
+    return game
+
+
+@contextmanager
+def mutate_game(game_id: str) -> Iterator[Game]:
+    """Edit a stored game in place, then save it back to the global game store.
+
+    Lets tests set up edge-case state (struck ships, empty broadsides, ended
+    games) directly instead of playing actions through the API to reach it.
+
+    Args:
+        game_id: ID of a game already in the store
+
+    Yields:
+        The stored game, to be modified inside the ``with`` block
+    """
+    store = get_game_store()
+    game = store.get_game(game_id)
+    assert game is not None, f"game {game_id!r} is not in the store"
+    yield game
+    store.update_game(game)
+
+
+def split_ships(ships: dict[str, dict]) -> tuple[list[dict], list[dict]]:
+    """Split a game state's ships into P1 and P2 lists in a single pass.
+
+    Args:
+        ships: The ``ships`` mapping of a JSON game state (already keyed by ID)
+
+    Returns:
+        Tuple of (P1 ships, P2 ships), each in game order
+    """
+    p1_ships: list[dict] = []
+    p2_ships: list[dict] = []
+    for ship in ships.values():
+        (p1_ships if ship["side"] == "P1" else p2_ships).append(ship)
+    return p1_ships, p2_ships
+
+
+def assert_no_overlap(ships: dict[str, dict]) -> None:
+    """Assert that no two ship hexes (bow or stern) in a JSON game state coincide.
+
+    Args:
+        ships: The ``ships`` mapping of a JSON game state
+    """
+    positions = [
+        (ship[end]["col"], ship[end]["row"])
+        for ship in ships.values()
+        for end in ("bow_hex", "stern_hex")
+    ]
+    if len(set(positions)) != len(positions):
+        duplicates = sorted(pos for pos, count in Counter(positions).items() if count > 1)
+        raise AssertionError(f"Ships overlap at {duplicates}")
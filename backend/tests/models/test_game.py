@@ -217,3 +217,32 @@ def test_game_validation_positive_turn_number() -> None:
             wind_direction=WindDirection.W,
             ships={"ship_1": ship1},
         )
+
+
+def test_game_fork_is_independent() -> None:
+    """Test forking a game copies state under a new ID without sharing it."""
+    ship1 = create_test_ship("ship_1", "HMS Test", Side.P1, 5, 10)
+    game = Game(
+        id="game_1",
+        scenario_id="test_scenario",
+        map_width=25,
+        map_height=20,
+        wind_direction=WindDirection.W,
+        ships={"ship_1": ship1},
+    )
+
+    fork = game.fork("game_2")
+
+    assert fork.id == "game_2"
+    assert fork.ships == game.ships
+    fork.ships["ship_1"].hull = 1
+    fork.add_event(
+        EventLogEntry(
+            turn_number=1,
+            phase=GamePhase.MOVEMENT,
+            event_type="movement",
+            summary="Ship moved",
+        )
+    )
+    assert game.ships["ship_1"].hull == 12
+    assert game.event_log == []
@@ -65,3 +65,10 @@ def test_hex_coord_repr() -> None:
     """Test HexCoord string representation."""
     coord = HexCoord(col=5, row=10)
     assert repr(coord) == "HexCoord(5, 10)"
+
+
+def test_hex_coord_is_immutable() -> None:
+    """Test HexCoord fields cannot be reassigned."""
+    coord = HexCoord(col=5, row=10)
+    with pytest.raises(ValidationError):
+        coord.col = 6
@@ -1,9 +1,10 @@
 """Tests for scenario loader."""
 
 import json
+import os
+import re
 import tempfile
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
@@ -12,10 +13,16 @@ from wsim_core.models.hex import HexCoord
 from wsim_core.serialization.scenario_loader import (
     ScenarioLoadError,
     initialize_game_from_scenario,
+    load_scenario_from_bytes,
     load_scenario_from_dict,
     load_scenario_from_file,
 )
 
+# Error-message patterns shared by the rejection tests below.
+_VALIDATION_FAILED = re.compile("validation failed")
+_DUPLICATE_IDS = re.compile("Duplicate ship IDs")
+_OUT_OF_BOUNDS = re.compile("outside map bounds")
+
 
 def test_load_valid_scenario_from_dict():
     """Test loading a valid scenario from a dictionary."""
@@ -102,7 +109,7 @@ def test_load_scenario_missing_required_field():
         "ships": [],
     }
 
-    with pytest.raises(ScenarioLoadError, match="validation failed"):
+    with pytest.raises(ScenarioLoadError, match=_VALIDATION_FAILED):
         load_scenario_from_dict(data)
 
 
@@ -118,7 +125,7 @@ def test_load_scenario_invalid_wind_direction():
         "ships": [],
     }
 
-    with pytest.raises(ScenarioLoadError, match="validation failed"):
+    with pytest.raises(ScenarioLoadError, match=_VALIDATION_FAILED):
         load_scenario_from_dict(data)
 
 
@@ -161,7 +168,7 @@ def test_load_scenario_duplicate_ship_ids():
         ],
     }
 
-    with pytest.raises(ScenarioLoadError, match="Duplicate ship IDs"):
+    with pytest.raises(ScenarioLoadError, match=_DUPLICATE_IDS):
         load_scenario_from_dict(data)
 
 
@@ -191,7 +198,7 @@ def test_load_scenario_ship_out_of_bounds():
         ],
     }
 
-    with pytest.raises(ScenarioLoadError, match="outside map bounds"):
+    with pytest.raises(ScenarioLoadError, match=_OUT_OF_BOUNDS):
         load_scenario_from_dict(data)
 
 
@@ -232,6 +239,46 @@ def test_load_scenario_from_file():
         Path(temp_path).unlink()
 
 
+def test_load_scenario_from_file_is_cached():
+    """Test that repeated loads of an unchanged file return the cached scenario."""
+    scenario_path = Path(__file__).parent.parent.parent / "scenarios" / "mvp_frigate_duel_v1.json"
+
+    first = load_scenario_from_file(scenario_path)
+    second = load_scenario_from_file(str(scenario_path))
+
+    assert first is second
+
+
+def test_load_scenario_from_file_cache_invalidated_on_change():
+    """Test that modifying a scenario file invalidates its cached entry."""
+    data = {
+        "id": "test_scenario",
+        "name": "Test Scenario",
+        "description": "A test scenario",
+        "map": {"width": 10, "height": 10},
+        "wind": {"direction": "N"},
+        "victory": {"type": "first_struck"},
+        "ships": [],
+    }
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+        json.dump(data, f)
+        temp_path = Path(f.name)
+
+    try:
+        assert load_scenario_from_file(temp_path).name == "Test Scenario"
+
+        data["name"] = "Renamed Scenario"
+        temp_path.write_text(json.dumps(data))
+        # Bump mtime explicitly so the change is visible on coarse-grained filesystems
+        stat = temp_path.stat()
+        os.utime(temp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert load_scenario_from_file(temp_path).name == "Renamed Scenario"
+    finally:
+        temp_path.unlink()
+
+
 def test_load_scenario_from_nonexistent_file():
     """Test that loading fails when file doesn't exist."""
     with pytest.raises(ScenarioLoadError, match="not found"):
@@ -247,35 +294,51 @@ def test_load_scenario_from_directory():
         load_scenario_from_file(tmpdir)
 
 
-def test_load_scenario_from_invalid_json_file():
+def test_load_scenario_from_invalid_json_bytes():
     """Test that loading fails when JSON is malformed."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        f.write("{ invalid json }")
-        temp_path = f.name
+    with pytest.raises(ScenarioLoadError, match="Invalid JSON in scenario data"):
+        load_scenario_from_bytes(b"{ invalid json }")
 
-    try:
-        with pytest.raises(ScenarioLoadError, match="Invalid JSON"):
-            load_scenario_from_file(temp_path)
-    finally:
-        Path(temp_path).unlink()
 
+def test_load_scenario_from_invalid_json_file(tmp_path: Path):
+    """Test that loading a malformed file from disk reports it as a file error."""
+    temp_path = tmp_path / "scenario.json"
+    temp_path.write_text("{ invalid json }")
+
+    with pytest.raises(ScenarioLoadError, match="Invalid JSON in scenario file"):
+        load_scenario_from_file(temp_path)
+
+
+def test_load_scenario_from_file_with_validation_error(tmp_path: Path):
+    """Test that load_scenario_from_file handles ValidationError correctly."""
+    # Scenario file missing the required "description" field
+    data = {
+        "id": "test_scenario",
+        "name": "Test Scenario",
+        "map": {"width": 10, "height": 10},
+        "wind": {"direction": "N"},
+        "victory": {"type": "first_struck"},
+        "ships": [],
+    }
+    temp_path = tmp_path / "scenario.json"
+    temp_path.write_text(json.dumps(data))
+
+    with pytest.raises(ScenarioLoadError, match=_VALIDATION_FAILED):
+        load_scenario_from_file(temp_path)
 
-def test_load_scenario_oserror_on_read():
+
+def test_load_scenario_oserror_on_read(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     """Test that OSError during file read is handled properly."""
-    # Create a temporary file that exists (so the file existence check passes)
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        f.write('{"test": "data"}')
-        temp_path = Path(f.name)
+    # The file exists, so the existence check passes and the read itself fails
+    temp_path = tmp_path / "scenario.json"
+    temp_path.write_text('{"test": "data"}')
 
-    try:
-        # Mock the open function to raise OSError when reading
-        with (
-            patch("builtins.open", side_effect=OSError("Permission denied")),
-            pytest.raises(ScenarioLoadError, match="Failed to read scenario file"),
-        ):
-            load_scenario_from_file(temp_path)
-    finally:
-        temp_path.unlink()
+    def fail_open(*args: object, **kwargs: object) -> None:
+        raise OSError("Permission denied")
+
+    monkeypatch.setattr("builtins.open", fail_open)
+    with pytest.raises(ScenarioLoadError, match="Failed to read scenario file"):
+        load_scenario_from_file(temp_path)
 
 
 def test_initialize_game_from_scenario():
@@ -364,8 +427,21 @@ def test_initialize_game_from_scenario():
     assert ship2.facing == Facing.W
 
 
-def test_stern_calculation_all_directions():
-    """Test stern hex calculation for all facing directions."""
+@pytest.mark.parametrize(
+    ("facing", "expected_col", "expected_row"),
+    [
+        ("N", 10, 11),  # South
+        ("NE", 9, 11),  # Southwest
+        ("E", 9, 10),  # West
+        ("SE", 9, 9),  # Northwest
+        ("S", 10, 9),  # North
+        ("SW", 11, 9),  # Northeast
+        ("W", 11, 10),  # East
+        ("NW", 11, 11),  # Southeast
+    ],
+)
+def test_stern_calculation_all_directions(facing: str, expected_col: int, expected_row: int):
+    """Test stern hex calculation for each facing direction, with the bow at (10, 10)."""
     data = {
         "id": "test_scenario",
         "name": "Test Scenario",
@@ -375,7 +451,7 @@ def test_stern_calculation_all_directions():
         "victory": {"type": "first_struck"},
         "ships": [
             {
-                "id": f"ship_{facing.lower()}",
+                "id": "ship1",
                 "side": "P1",
                 "name": f"Ship {facing}",
                 "battle_sail_speed": 3,
@@ -387,29 +463,13 @@ def test_stern_calculation_all_directions():
                 "marines": 2,
                 "initial_load": {"L": "R", "R": "R"},
             }
-            for facing in ["N", "NE", "E", "SE", "S", "SW", "W", "NW"]
         ],
     }
 
     scenario = load_scenario_from_dict(data)
     game = initialize_game_from_scenario(scenario, "game123")
 
-    # Expected stern positions relative to bow at (10, 10)
-    expected_sterns = {
-        "N": (10, 11),  # South
-        "NE": (9, 11),  # Southwest
-        "E": (9, 10),  # West
-        "SE": (9, 9),  # Northwest
-        "S": (10, 9),  # North
-        "SW": (11, 9),  # Northeast
-        "W": (11, 10),  # East
-        "NW": (11, 11),  # Southeast
-    }
-
-    for facing, (expected_col, expected_row) in expected_sterns.items():
-        ship = game.ships[f"ship_{facing.lower()}"]
-        assert ship.stern_hex.col == expected_col, f"Failed for {facing} facing (col)"
-        assert ship.stern_hex.row == expected_row, f"Failed for {facing} facing (row)"
+    assert game.ships["ship1"].stern_hex == HexCoord(col=expected_col, row=expected_row)
 
 
 def test_load_real_scenario_frigate_duel():
@@ -465,9 +525,9 @@ def test_load_real_scenario_two_ship_line_battle():
         assert len(game.ships) == 4
 
 
-def test_load_scenario_from_file_with_validation_error():
-    """Test that load_scenario_from_file handles ValidationError correctly."""
-    # Create a temporary JSON file with invalid scenario data (missing required field)
+def test_load_scenario_from_bytes_with_validation_error():
+    """Test that load_scenario_from_bytes handles ValidationError correctly."""
+    # Scenario JSON missing a required field
     data = {
         "id": "test_scenario",
         "name": "Test Scenario",
@@ -478,20 +538,13 @@ def test_load_scenario_from_file_with_validation_error():
         "ships": [],
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(data, f)
-        temp_file = f.name
+    with pytest.raises(ScenarioLoadError, match=_VALIDATION_FAILED):
+        load_scenario_from_bytes(json.dumps(data).encode())
 
-    try:
-        with pytest.raises(ScenarioLoadError, match="validation failed"):
-            load_scenario_from_file(temp_file)
-    finally:
-        Path(temp_file).unlink()
 
-
-def test_load_scenario_from_file_with_value_error_duplicate_ids():
-    """Test that load_scenario_from_file handles ValueError from duplicate ship IDs."""
-    # Create a temporary JSON file with duplicate ship IDs
+def test_load_scenario_from_bytes_with_value_error_duplicate_ids():
+    """Test that load_scenario_from_bytes handles ValueError from duplicate ship IDs."""
+    # Scenario JSON with duplicate ship IDs
     data = {
         "id": "test_scenario",
         "name": "Test Scenario",
@@ -529,20 +582,13 @@ def test_load_scenario_from_file_with_value_error_duplicate_ids():
         ],
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(data, f)
-        temp_file = f.name
-
-    try:
-        with pytest.raises(ScenarioLoadError, match="Duplicate ship IDs"):
-            load_scenario_from_file(temp_file)
-    finally:
-        Path(temp_file).unlink()
+    with pytest.raises(ScenarioLoadError, match=_DUPLICATE_IDS):
+        load_scenario_from_bytes(json.dumps(data).encode())
 
 
-def test_load_scenario_from_file_with_value_error_out_of_bounds():
-    """Test that load_scenario_from_file handles ValueError from ship out of bounds."""
-    # Create a temporary JSON file with ship out of bounds
+def test_load_scenario_from_bytes_with_value_error_out_of_bounds():
+    """Test that load_scenario_from_bytes handles ValueError from ship out of bounds."""
+    # Scenario JSON with ship out of bounds
     data = {
         "id": "test_scenario",
         "name": "Test Scenario",
@@ -567,12 +613,5 @@ def test_load_scenario_from_file_with_value_error_out_of_bounds():
         ],
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-        json.dump(data, f)
-        temp_file = f.name
-
-    try:
-        with pytest.raises(ScenarioLoadError, match="outside map bounds"):
-            load_scenario_from_file(temp_file)
-    finally:
-        Path(temp_file).unlink()
+    with pytest.raises(ScenarioLoadError, match=_OUT_OF_BOUNDS):
+        load_scenario_from_bytes(json.dumps(data).encode())
@@ -1,45 +1,50 @@
 """Tests for FastAPI application."""
 
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 
-from wsim_api.main import app
 from wsim_api.store import get_game_store
+from wsim_core.models.game import Game
+
+pytestmark = pytest.mark.usefixtures("reset_game_store")
 
-client = TestClient(app)
 
+def _json(response: httpx.Response) -> Any:
+    """Decode a response body with orjson."""
+    return orjson.loads(response.content)
 
-@pytest.fixture(autouse=True)
-def reset_game_store() -> None:
-    """Reset game store before each test."""
-    store = get_game_store()
-    # Clear all games
-    for game in list(store.list_games()):
-        store.delete_game(game.id)
 
+@pytest.fixture
+def created_game(fresh_game: Callable[[str], Game]) -> tuple[str, dict]:
+    """Store a Frigate Duel game and return its ID and initial state."""
+    game = fresh_game("mvp_frigate_duel_v1")
+    return game.id, game.model_dump(mode="json")
 
-def test_root() -> None:
+
+def test_root(client: TestClient) -> None:
     """Test root endpoint."""
     response = client.get("/")
     assert response.status_code == 200
-    data = response.json()
+    data = _json(response)
     assert data["message"] == "Wooden Ships & Iron Men API"
     assert data["version"] == "0.1.0"
 
 
-def test_health() -> None:
+def test_health(client: TestClient) -> None:
     """Test health check endpoint."""
     response = client.get("/health")
     assert response.status_code == 200
-    assert response.json() == {"status": "ok"}
+    assert _json(response) == {"status": "ok"}
 
 
-def test_list_scenarios() -> None:
+def test_list_scenarios(scenarios_list: list[dict]) -> None:
     """Test listing available scenarios."""
-    response = client.get("/games/scenarios")
-    assert response.status_code == 200
-
-    scenarios = response.json()
+    scenarios = scenarios_list
     assert isinstance(scenarios, list)
     assert len(scenarios) > 0
 
@@ -56,7 +61,7 @@ def test_list_scenarios() -> None:
         assert "description" in scenario
 
 
-def test_create_game() -> None:
+def test_create_game(client: TestClient) -> None:
     """Test creating a new game from a scenario."""
     response = client.post(
         "/games",
@@ -64,7 +69,7 @@ def test_create_game() -> None:
     )
     assert response.status_code == 201
 
-    data = response.json()
+    data = _json(response)
     assert "game_id" in data
     assert "state" in data
 
@@ -76,51 +81,83 @@ def test_create_game() -> None:
     assert len(game_state["ships"]) == 2
 
 
-def test_create_game_invalid_scenario() -> None:
+def test_create_game_with_seed(client: TestClient) -> None:
+    """Test that a creation seed is stored on the game; default is unseeded."""
+    seeded = client.post("/games", json={"scenario_id": "mvp_frigate_duel_v1", "seed": 7})
+    unseeded = client.post("/games", json={"scenario_id": "mvp_frigate_duel_v1"})
+
+    assert seeded.status_code == 201
+    assert _json(seeded)["state"]["rng_seed"] == 7
+    assert _json(unseeded)["state"]["rng_seed"] is None
+
+
+@pytest.mark.parametrize("seed", [-1, 2**63, 2**64])
+def test_create_game_rejects_out_of_range_seed(client: TestClient, seed: int) -> None:
+    """Test that a seed outside the 64-bit range is rejected before a game is stored."""
+    # Encoded by hand: orjson cannot encode the oversized seed on the client side either
+    body = f'{{"scenario_id": "mvp_frigate_duel_v1", "seed": {seed}}}'
+    response = client.post("/games", content=body, headers={"content-type": "application/json"})
+
+    assert response.status_code == 422
+    assert get_game_store().list_games() == []
+
+
+def test_create_game_state_is_independent(client: TestClient) -> None:
+    """Test that games created from the same scenario share no mutable state."""
+    first = _json(client.post("/games", json={"scenario_id": "mvp_frigate_duel_v1"}))
+    ship_id = next(iter(first["state"]["ships"]))
+    game = get_game_store().get_game(first["game_id"])
+    assert game is not None
+    game.ships[ship_id].hull = 0
+
+    second = _json(client.post("/games", json={"scenario_id": "mvp_frigate_duel_v1"}))
+
+    assert second["game_id"] != first["game_id"]
+    assert second["state"]["ships"][ship_id]["hull"] == first["state"]["ships"][ship_id]["hull"]
+
+
+def test_create_game_invalid_scenario(client: TestClient) -> None:
     """Test creating game with non-existent scenario."""
     response = client.post(
         "/games",
         json={"scenario_id": "nonexistent_scenario"},
     )
     assert response.status_code == 404
-    assert "not found" in response.json()["detail"].lower()
+    assert "not found" in _json(response)["detail"].lower()
 
 
-def test_get_game() -> None:
+def test_get_game(client: TestClient, created_game: tuple[str, dict]) -> None:
     """Test retrieving a game by ID."""
-    # First create a game
-    create_response = client.post(
-        "/games",
-        json={"scenario_id": "mvp_frigate_duel_v1"},
-    )
-    assert create_response.status_code == 201
-    game_id = create_response.json()["game_id"]
+    game_id, _ = created_game
 
-    # Now retrieve it
     get_response = client.get(f"/games/{game_id}")
     assert get_response.status_code == 200
 
-    game_state = get_response.json()
+    game_state = _json(get_response)
     assert game_state["id"] == game_id
     assert game_state["scenario_id"] == "mvp_frigate_duel_v1"
 
 
-def test_get_game_not_found() -> None:
+def test_get_game_matches_stored_state(client: TestClient, created_game: tuple[str, dict]) -> None:
+    """Test GET returns exactly the stored game's JSON dump.
+
+    Test fixtures read state straight from the store on that basis.
+    """
+    game_id, stored_state = created_game
+
+    assert _json(client.get(f"/games/{game_id}")) == stored_state
+
+
+def test_get_game_not_found(client: TestClient) -> None:
     """Test retrieving non-existent game."""
     response = client.get("/games/nonexistent-game-id")
     assert response.status_code == 404
-    assert "not found" in response.json()["detail"].lower()
+    assert "not found" in _json(response)["detail"].lower()
 
 
-def test_delete_game() -> None:
+def test_delete_game(client: TestClient, created_game: tuple[str, dict]) -> None:
     """Test deleting a game."""
-    # First create a game
-    create_response = client.post(
-        "/games",
-        json={"scenario_id": "mvp_frigate_duel_v1"},
-    )
-    assert create_response.status_code == 201
-    game_id = create_response.json()["game_id"]
+    game_id, _ = created_game
 
     # Delete it
     delete_response = client.delete(f"/games/{game_id}")
@@ -131,7 +168,7 @@ def test_delete_game() -> None:
     assert get_response.status_code == 404
 
 
-def test_delete_game_not_found() -> None:
+def test_delete_game_not_found(client: TestClient) -> None:
     """Test deleting non-existent game."""
     response = client.delete("/games/nonexistent-game-id")
     assert response.status_code == 404
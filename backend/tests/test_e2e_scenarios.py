@@ -12,21 +12,83 @@ Each test verifies:
 - All phases execute without errors
 """
 
+from collections.abc import Callable
+
 import pytest
 from fastapi.testclient import TestClient
 
-from wsim_api.main import app
-from wsim_api.store import get_game_store
+from .game_driver import GameDriver
+from .helpers import SCENARIO_IDS, assert_no_overlap, mutate_game, split_ships
+
+pytestmark = pytest.mark.usefixtures("reset_game_store")
+
+NO_LOG = {"include_log": "false"}
+
 
-client = TestClient(app)
+@pytest.mark.parametrize("scenario_id", SCENARIO_IDS)
+class TestAllScenarios:
+    """Turn-loop checks shared by every bundled scenario."""
 
+    def test_game_state_consistency(
+        self, scenario_id: str, game_driver: Callable[[str], GameDriver]
+    ) -> None:
+        """Test that game state remains consistent through one full turn.
 
-@pytest.fixture(autouse=True)
-def reset_game_store() -> None:
-    """Reset game store before each test."""
-    store = get_game_store()
-    for game in list(store.list_games()):
-        store.delete_game(game.id)
+        Verifies:
+        - One movement event per ship and no overlapping ships after movement
+        - Ship positions are valid and hull/rigging/crew/guns never go negative
+        - Phase transitions follow the correct sequence
+        - Load states are restored by reload
+        """
+        driver = game_driver(scenario_id)
+        ship_count = len(driver.initial_state["ships"])
+
+        driver.plan(*driver.uniform_orders("1"))
+        movement_state, movement_events = driver.resolve_movement()
+        assert movement_state["phase"] == "combat"
+
+        movement_events = [e for e in movement_events if e["event_type"] == "movement"]
+        assert len(movement_events) == ship_count
+        assert_no_overlap(movement_state["ships"])
+
+        for ship in movement_state["ships"].values():
+            for end in ("bow_hex", "stern_hex"):
+                assert ship[end]["col"] >= 0
+                assert ship[end]["row"] >= 0
+            for stat in ("hull", "rigging", "crew", "guns_L", "guns_R"):
+                assert ship[stat] >= 0
+
+        reload_state, _ = driver.resolve_reload()
+        assert reload_state["phase"] == "reload"
+
+        next_state = driver.advance()
+        assert next_state["phase"] == "planning"
+        assert next_state["turn_number"] == 2
+
+        for ship in next_state["ships"].values():
+            if not ship["struck"]:
+                # Broadsides with guns are loaded after reload (no combat this turn)
+                if ship["guns_L"] > 0:
+                    assert ship["load_L"] == "R"
+                if ship["guns_R"] > 0:
+                    assert ship["load_R"] == "R"
+
+    def test_turn_limit_not_exceeded(
+        self, scenario_id: str, game_driver: Callable[[str], GameDriver]
+    ) -> None:
+        """Test that turns increment by one and never pass the scenario turn limit."""
+        driver = game_driver(scenario_id)
+        turn_limit = driver.initial_state["turn_limit"]
+        hold_position = driver.uniform_orders("0")
+
+        state = driver.initial_state
+        for turn_num in range(1, 6):
+            assert state["turn_number"] == turn_num
+            state, _ = driver.run_turn(*hold_position)
+            if state["game_ended"]:
+                break
+
+        assert state["turn_number"] <= turn_limit
 
 
 class TestScenario1FrigateDuel:
@@ -36,19 +98,20 @@ class TestScenario1FrigateDuel:
     the basic game loop and victory conditions.
     """
 
-    def test_complete_game_with_combat(self) -> None:
+    def test_complete_game_with_combat(self, client: TestClient) -> None:
         """Test a complete game playthrough with ships engaging in combat.
 
         This test verifies:
         - Game creation from scenario
         - Multiple turns of movement and combat
         - Damage application and accumulation
-        - Victory condition when a ship strikes
+
+        The game is seeded, so the turn 2 exchange of fire is deterministic.
         """
         # Create game
         create_response = client.post(
             "/games",
-            json={"scenario_id": "mvp_frigate_duel_v1"},
+            json={"scenario_id": "mvp_frigate_duel_v1", "seed": 42},
         )
         assert create_response.status_code == 201
         game_id = create_response.json()["game_id"]
@@ -59,231 +122,114 @@ class TestScenario1FrigateDuel:
         assert initial_state["phase"] == "planning"
         assert len(initial_state["ships"]) == 2
         assert initial_state["game_ended"] is False
+        assert initial_state["rng_seed"] == 42
 
         # Get ship IDs
         ships = initial_state["ships"]
-        p1_ship = next(s for s in ships.values() if s["side"] == "P1")
-        p2_ship = next(s for s in ships.values() if s["side"] == "P2")
+        (p1_ship,), (p2_ship,) = split_ships(ships)
         p1_ship_id = p1_ship["id"]
         p2_ship_id = p2_ship["id"]
 
-        # Play through multiple turns
-        for turn_num in range(1, 4):
-            # Both players submit orders to close distance and engage
-            # Turn 1: Both move forward
-            if turn_num == 1:
-                p1_orders = [{"ship_id": p1_ship_id, "movement_string": "2"}]
-                p2_orders = [{"ship_id": p2_ship_id, "movement_string": "2"}]
-            # Turn 2: Adjust facing and move closer
-            elif turn_num == 2:
-                p1_orders = [{"ship_id": p1_ship_id, "movement_string": "R1"}]
-                p2_orders = [{"ship_id": p2_ship_id, "movement_string": "L1"}]
-            # Turn 3: Move into firing range
-            else:
-                p1_orders = [{"ship_id": p1_ship_id, "movement_string": "1"}]
-                p2_orders = [{"ship_id": p2_ship_id, "movement_string": "1"}]
-
-            # P1 submits orders
-            p1_submit = client.post(
-                f"/games/{game_id}/turns/{turn_num}/orders",
-                json={"side": "P1", "orders": p1_orders},
-            )
-            assert p1_submit.status_code == 200
+        # Phase responses omit the event log; collect new events as they arrive
+        seen_event_types: set[str] = set()
 
-            # P2 submits orders
-            p2_submit = client.post(
-                f"/games/{game_id}/turns/{turn_num}/orders",
-                json={"side": "P2", "orders": p2_orders},
-            )
-            assert p2_submit.status_code == 200
+        def plan_and_move(turn_num: int, p1_move: str, p2_move: str) -> dict:
+            """Submit orders for both sides, mark ready and resolve movement."""
+            for side, ship_id, move in (("P1", p1_ship_id, p1_move), ("P2", p2_ship_id, p2_move)):
+                submit = client.post(
+                    f"/games/{game_id}/turns/{turn_num}/orders",
+                    json={"side": side, "orders": [{"ship_id": ship_id, "movement_string": move}]},
+                )
+                assert submit.status_code == 200
 
-            # P1 marks ready
-            p1_ready = client.post(
-                f"/games/{game_id}/turns/{turn_num}/ready",
-                json={"side": "P1"},
-            )
-            assert p1_ready.status_code == 200
+            ready_url = f"/games/{game_id}/turns/{turn_num}/ready"
+            assert client.post(ready_url, json={"side": "P1"}).json()["both_ready"] is False
+            assert client.post(ready_url, json={"side": "P2"}).json()["both_ready"] is True
 
-            # P2 marks ready
-            p2_ready = client.post(
-                f"/games/{game_id}/turns/{turn_num}/ready",
-                json={"side": "P2"},
+            movement_response = client.post(
+                f"/games/{game_id}/turns/{turn_num}/resolve/movement", params=NO_LOG
             )
-            assert p2_ready.status_code == 200
-            assert p2_ready.json()["both_ready"] is True
-
-            # Resolve movement
-            movement_response = client.post(f"/games/{game_id}/turns/{turn_num}/resolve/movement")
             assert movement_response.status_code == 200
-            movement_state = movement_response.json()["state"]
-            assert movement_state["phase"] == "combat"
-
-            # Verify movement events were created
-            movement_events = movement_response.json()["events"]
-            assert len(movement_events) > 0
-            assert any(e["event_type"] == "movement" for e in movement_events)
-
-            # Get current game state
-            game_response = client.get(f"/games/{game_id}")
-            assert game_response.status_code == 200
-            game_state = game_response.json()
-
-            # Check if game ended due to victory condition
-            if game_state["game_ended"]:
-                assert game_state["winner"] is not None
-                break
-
-            # Get broadside arc info for P1 ship's right broadside
-            arc_response = client.get(f"/games/{game_id}/ships/{p1_ship_id}/broadside/R/arc")
-            assert arc_response.status_code == 200
-            arc_data = arc_response.json()
-
-            # Fire broadsides if targets are in range
-            if p2_ship_id in arc_data["valid_targets"]:
-                fire_response = client.post(
-                    f"/games/{game_id}/turns/{turn_num}/combat/fire",
-                    json={
-                        "ship_id": p1_ship_id,
-                        "broadside": "R",
-                        "target_ship_id": p2_ship_id,
-                        "aim": "hull",
-                    },
-                )
-                assert fire_response.status_code == 200
-                fire_events = fire_response.json()["events"]
-                assert len(fire_events) > 0
-                assert fire_events[0]["event_type"] == "broadside_fire"
-
-            # P2 fires back if in range
-            arc_response_p2 = client.get(f"/games/{game_id}/ships/{p2_ship_id}/broadside/L/arc")
-            assert arc_response_p2.status_code == 200
-            arc_data_p2 = arc_response_p2.json()
-
-            if p1_ship_id in arc_data_p2["valid_targets"]:
-                fire_response_p2 = client.post(
-                    f"/games/{game_id}/turns/{turn_num}/combat/fire",
-                    json={
-                        "ship_id": p2_ship_id,
-                        "broadside": "L",
-                        "target_ship_id": p1_ship_id,
-                        "aim": "hull",
-                    },
-                )
-                assert fire_response_p2.status_code == 200
-
-            # Check if game ended after combat
-            game_response = client.get(f"/games/{game_id}")
-            game_state = game_response.json()
-            if game_state["game_ended"]:
-                assert game_state["winner"] is not None
-                break
-
-            # Reload
-            reload_response = client.post(f"/games/{game_id}/turns/{turn_num}/resolve/reload")
+            movement = movement_response.json()
+            assert movement["state"]["phase"] == "combat"
+            assert movement["state"]["event_log"] == []
+            seen_event_types.update(e["event_type"] for e in movement["events"])
+            assert "movement" in seen_event_types
+            return movement["state"]
+
+        def reload_and_advance(turn_num: int) -> None:
+            """Resolve reload and advance to the next turn."""
+            reload_response = client.post(
+                f"/games/{game_id}/turns/{turn_num}/resolve/reload", params=NO_LOG
+            )
             assert reload_response.status_code == 200
+            seen_event_types.update(e["event_type"] for e in reload_response.json()["events"])
             reload_state = reload_response.json()["state"]
             assert reload_state["phase"] == "reload"
+            assert reload_state["game_ended"] is False
 
-            # Verify reload events
-            reload_events = reload_response.json()["events"]
-            assert len(reload_events) > 0
-
-            # Check if game ended after reload (e.g., turn limit)
-            if reload_state["game_ended"]:
-                assert reload_state["winner"] is not None
-                break
-
-            # Advance turn
-            advance_response = client.post(f"/games/{game_id}/turns/{turn_num}/advance")
+            advance_response = client.post(
+                f"/games/{game_id}/turns/{turn_num}/advance", params=NO_LOG
+            )
             assert advance_response.status_code == 200
             next_state = advance_response.json()["state"]
             assert next_state["turn_number"] == turn_num + 1
             assert next_state["phase"] == "planning"
-
-            # Verify orders were cleared
             assert next_state["p1_orders"] is None
             assert next_state["p2_orders"] is None
 
-        # Verify final game state has event log entries
-        final_game = client.get(f"/games/{game_id}")
-        final_state = final_game.json()
-        assert len(final_state["event_log"]) > 0
-
-        # Verify we have events for all phases
-        event_types = {e["event_type"] for e in final_state["event_log"]}
-        assert "movement" in event_types
-
-    def test_game_state_consistency(self) -> None:
-        """Test that game state remains consistent throughout a playthrough.
-
-        Verifies:
-        - Ship positions are valid after movement
-        - Hull/rigging/crew never go negative
-        - Load states transition correctly
-        - Phase transitions follow the correct sequence
-        """
-        # Create game
-        create_response = client.post(
-            "/games",
-            json={"scenario_id": "mvp_frigate_duel_v1"},
-        )
-        assert create_response.status_code == 201
-        game_id = create_response.json()["game_id"]
-        initial_state = create_response.json()["state"]
-
-        ships = initial_state["ships"]
-        p1_ship_id = next(s["id"] for s in ships.values() if s["side"] == "P1")
-        p2_ship_id = next(s["id"] for s in ships.values() if s["side"] == "P2")
-
-        # Execute one complete turn
-        turn_num = 1
-
-        # Submit orders
-        client.post(
-            f"/games/{game_id}/turns/{turn_num}/orders",
-            json={"side": "P1", "orders": [{"ship_id": p1_ship_id, "movement_string": "1"}]},
-        )
-        client.post(
-            f"/games/{game_id}/turns/{turn_num}/orders",
-            json={"side": "P2", "orders": [{"ship_id": p2_ship_id, "movement_string": "1"}]},
+        # Turn 1: both close distance; still out of each other's arcs
+        state = plan_and_move(1, "2", "2")
+        arcs = client.get(f"/games/{game_id}/broadsides/arcs").json()["arcs"]
+        assert all(
+            not arc["valid_targets"] for by_side in arcs.values() for arc in by_side.values()
         )
-
-        # Mark ready
-        client.post(f"/games/{game_id}/turns/{turn_num}/ready", json={"side": "P1"})
-        client.post(f"/games/{game_id}/turns/{turn_num}/ready", json={"side": "P2"})
-
-        # Resolve movement and check state
-        movement_response = client.post(f"/games/{game_id}/turns/{turn_num}/resolve/movement")
-        movement_state = movement_response.json()["state"]
-
-        # Verify all ships have valid positions
-        for ship in movement_state["ships"].values():
-            assert ship["bow_hex"]["col"] >= 0
-            assert ship["bow_hex"]["row"] >= 0
-            assert ship["stern_hex"]["col"] >= 0
-            assert ship["stern_hex"]["row"] >= 0
-
-            # Verify stats are non-negative
-            assert ship["hull"] >= 0
-            assert ship["rigging"] >= 0
-            assert ship["crew"] >= 0
-            assert ship["guns_L"] >= 0
-            assert ship["guns_R"] >= 0
-
-        # Reload and advance
-        client.post(f"/games/{game_id}/turns/{turn_num}/resolve/reload")
-        advance_response = client.post(f"/games/{game_id}/turns/{turn_num}/advance")
-        next_state = advance_response.json()["state"]
-
-        # Verify load states were restored
-        for ship in next_state["ships"].values():
-            if not ship["struck"]:
-                # Non-struck ships should have loaded broadsides after reload
-                # (unless they have no guns)
-                if ship["guns_L"] > 0:
-                    assert ship["load_L"] in ["R", "empty"]  # May still be empty if damaged
-                if ship["guns_R"] > 0:
-                    assert ship["load_R"] in ["R", "empty"]
+        assert state["ships"][p1_ship_id]["hull"] == 12
+        reload_and_advance(1)
+
+        # Turn 2: turn towards each other, bringing P1's L and P2's R broadsides to bear
+        plan_and_move(2, "R1", "L1")
+        arcs = client.get(f"/games/{game_id}/broadsides/arcs").json()["arcs"]
+        assert arcs[p1_ship_id]["L"]["valid_targets"] == [p2_ship_id]
+        assert arcs[p2_ship_id]["R"]["valid_targets"] == [p1_ship_id]
+
+        for ship_id, broadside, target_id in (
+            (p1_ship_id, "L", p2_ship_id),
+            (p2_ship_id, "R", p1_ship_id),
+        ):
+            fire_response = client.post(
+                f"/games/{game_id}/turns/2/combat/fire",
+                params=NO_LOG,
+                json={
+                    "ship_id": ship_id,
+                    "broadside": broadside,
+                    "target_ship_id": target_id,
+                    "aim": "hull",
+                },
+            )
+            assert fire_response.status_code == 200
+            fire_events = fire_response.json()["events"]
+            assert fire_events[0]["event_type"] == "broadside_fire"
+            seen_event_types.update(e["event_type"] for e in fire_events)
+            state = fire_response.json()["state"]
+
+        # Exact damage for seed 42
+        p1_after = state["ships"][p1_ship_id]
+        p2_after = state["ships"][p2_ship_id]
+        assert (p1_after["hull"], p1_after["crew"]) == (11, 8)
+        assert (p2_after["hull"], p2_after["crew"]) == (6, 6)
+        assert p1_after["load_L"] == "E"
+        assert p2_after["load_R"] == "E"
+        assert state["game_ended"] is False
+
+        reload_and_advance(2)
+
+        # The full log, fetched once, holds every event the phase responses returned
+        final_state = client.get(f"/games/{game_id}").json()
+        event_types = {e["event_type"] for e in final_state["event_log"]}
+        assert {"movement", "broadside_fire"} <= seen_event_types <= event_types
+        assert final_state["ships"][p1_ship_id]["load_L"] == "R"
+        assert final_state["ships"][p2_ship_id]["load_R"] == "R"
 
 
 class TestScenario2CrossingPaths:
@@ -293,7 +239,7 @@ class TestScenario2CrossingPaths:
     converging courses.
     """
 
-    def test_collision_and_fouling(self) -> None:
+    def test_collision_and_fouling(self, game_driver: Callable[[str], GameDriver]) -> None:
         """Test that collisions are detected and fouling is applied.
 
         Verifies:
@@ -302,51 +248,15 @@ class TestScenario2CrossingPaths:
         - Movement is truncated appropriately
         - Collision events are logged
         """
-        # Create game
-        create_response = client.post(
-            "/games",
-            json={"scenario_id": "mvp_crossing_paths_v1"},
-        )
-        assert create_response.status_code == 201
-        game_id = create_response.json()["game_id"]
-        initial_state = create_response.json()["state"]
+        driver = game_driver("mvp_crossing_paths_v1")
 
-        assert len(initial_state["ships"]) == 4  # 2v2 scenario
-
-        # Get ship IDs
-        ships = initial_state["ships"]
-        p1_ships = [s for s in ships.values() if s["side"] == "P1"]
-        p2_ships = [s for s in ships.values() if s["side"] == "P2"]
-
-        turn_num = 1
+        assert len(driver.initial_state["ships"]) == 4  # 2v2 scenario
 
         # Submit orders that will cause ships to cross paths
-        p1_orders = [
-            {"ship_id": p1_ships[0]["id"], "movement_string": "2"},
-            {"ship_id": p1_ships[1]["id"], "movement_string": "2"},
-        ]
-        p2_orders = [
-            {"ship_id": p2_ships[0]["id"], "movement_string": "2"},
-            {"ship_id": p2_ships[1]["id"], "movement_string": "2"},
-        ]
-
-        client.post(
-            f"/games/{game_id}/turns/{turn_num}/orders",
-            json={"side": "P1", "orders": p1_orders},
-        )
-        client.post(
-            f"/games/{game_id}/turns/{turn_num}/orders",
-            json={"side": "P2", "orders": p2_orders},
-        )
-
-        client.post(f"/games/{game_id}/turns/{turn_num}/ready", json={"side": "P1"})
-        client.post(f"/games/{game_id}/turns/{turn_num}/ready", json={"side": "P2"})
+        driver.plan(*driver.uniform_orders("2"))
 
         # Resolve movement
-        movement_response = client.post(f"/games/{game_id}/turns/{turn_num}/resolve/movement")
-        assert movement_response.status_code == 200
-
-        movement_events = movement_response.json()["events"]
+        _, movement_events = driver.resolve_movement()
 
         # Check if collision events were created
         # Note: Collision might not happen on turn 1 depending on initial positions
@@ -363,68 +273,6 @@ class TestScenario2CrossingPaths:
             # but we can verify the event was logged
             assert any(e["event_type"] == "fouling_check" for e in movement_events)
 
-    def test_multi_ship_movement(self) -> None:
-        """Test simultaneous movement with multiple ships per side.
-
-        Verifies:
-        - All ships move correctly
-        - No ships overlap after movement
-        - Movement events created for all ships
-        """
-        # Create game
-        create_response = client.post(
-            "/games",
-            json={"scenario_id": "mvp_crossing_paths_v1"},
-        )
-        game_id = create_response.json()["game_id"]
-        initial_state = create_response.json()["state"]
-
-        ships = initial_state["ships"]
-        p1_ships = [s for s in ships.values() if s["side"] == "P1"]
-        p2_ships = [s for s in ships.values() if s["side"] == "P2"]
-
-        turn_num = 1
-
-        # Submit simple forward movement for all ships
-        p1_orders = [{"ship_id": s["id"], "movement_string": "1"} for s in p1_ships]
-        p2_orders = [{"ship_id": s["id"], "movement_string": "1"} for s in p2_ships]
-
-        client.post(
-            f"/games/{game_id}/turns/{turn_num}/orders",
-            json={"side": "P1", "orders": p1_orders},
-        )
-        client.post(
-            f"/games/{game_id}/turns/{turn_num}/orders",
-            json={"side": "P2", "orders": p2_orders},
-        )
-
-        client.post(f"/games/{game_id}/turns/{turn_num}/ready", json={"side": "P1"})
-        client.post(f"/games/{game_id}/turns/{turn_num}/ready", json={"side": "P2"})
-
-        # Resolve movement
-        movement_response = client.post(f"/games/{game_id}/turns/{turn_num}/resolve/movement")
-        assert movement_response.status_code == 200
-
-        movement_state = movement_response.json()["state"]
-        movement_events = movement_response.json()["events"]
-
-        # Verify we have movement events for all ships
-        ship_movement_events = [e for e in movement_events if e["event_type"] == "movement"]
-        assert len(ship_movement_events) == 4  # One per ship
-
-        # Verify no ships occupy the same hexes
-        ship_hexes = set()
-        for ship in movement_state["ships"].values():
-            bow = (ship["bow_hex"]["col"], ship["bow_hex"]["row"])
-            stern = (ship["stern_hex"]["col"], ship["stern_hex"]["row"])
-
-            # Each ship hex should be unique
-            assert bow not in ship_hexes, f"Duplicate bow position: {bow}"
-            assert stern not in ship_hexes, f"Duplicate stern position: {stern}"
-
-            ship_hexes.add(bow)
-            ship_hexes.add(stern)
-
 
 class TestScenario3TwoShipLineBattle:
     """End-to-end tests for Scenario 3: Two-Ship Line Battle.
@@ -432,7 +280,7 @@ class TestScenario3TwoShipLineBattle:
     This scenario tests multi-ship targeting and the closest-target rule.
     """
 
-    def test_closest_target_enforcement(self) -> None:
+    def test_closest_target_enforcement(self, game_driver: Callable[[str], GameDriver]) -> None:
         """Test that closest-target rule is enforced correctly.
 
         Verifies:
@@ -440,52 +288,21 @@ class TestScenario3TwoShipLineBattle:
         - Friendly ships don't block targeting
         - Target selection follows the rules
         """
-        # Create game
-        create_response = client.post(
-            "/games",
-            json={"scenario_id": "mvp_two_ship_line_battle_v1"},
-        )
-        assert create_response.status_code == 201
-        game_id = create_response.json()["game_id"]
-        initial_state = create_response.json()["state"]
-
-        assert len(initial_state["ships"]) == 4
+        driver = game_driver("mvp_two_ship_line_battle_v1")
 
-        ships = initial_state["ships"]
-        p1_ships = [s for s in ships.values() if s["side"] == "P1"]
-        p2_ships = [s for s in ships.values() if s["side"] == "P2"]
+        ships = driver.initial_state["ships"]
+        assert len(ships) == 4
 
-        turn_num = 1
+        p1_ships, _ = split_ships(ships)
 
         # Move ships closer
-        p1_orders = [{"ship_id": s["id"], "movement_string": "2"} for s in p1_ships]
-        p2_orders = [{"ship_id": s["id"], "movement_string": "2"} for s in p2_ships]
-
-        client.post(
-            f"/games/{game_id}/turns/{turn_num}/orders",
-            json={"side": "P1", "orders": p1_orders},
-        )
-        client.post(
-            f"/games/{game_id}/turns/{turn_num}/orders",
-            json={"side": "P2", "orders": p2_orders},
-        )
-
-        client.post(f"/games/{game_id}/turns/{turn_num}/ready", json={"side": "P1"})
-        client.post(f"/games/{game_id}/turns/{turn_num}/ready", json={"side": "P2"})
-
-        # Resolve movement
-        movement_response = client.post(f"/games/{game_id}/turns/{turn_num}/resolve/movement")
-        assert movement_response.status_code == 200
+        driver.plan(*driver.uniform_orders("2"))
+        driver.resolve_movement()
 
         # Check broadside arcs and valid targets for each ship
+        all_arcs = driver.all_arcs()
         for ship in p1_ships:
-            for broadside in ["L", "R"]:
-                arc_response = client.get(
-                    f"/games/{game_id}/ships/{ship['id']}/broadside/{broadside}/arc"
-                )
-                assert arc_response.status_code == 200
-                arc_data = arc_response.json()
-
+            for arc_data in all_arcs[ship["id"]].values():
                 # If there are ships in arc, verify valid targets are a subset
                 if arc_data["ships_in_arc"]:
                     valid_targets = set(arc_data["valid_targets"])
@@ -499,7 +316,7 @@ class TestScenario3TwoShipLineBattle:
                         target_ship = next(s for s in ships.values() if s["id"] == target_id)
                         assert target_ship["side"] != ship["side"]
 
-    def test_multi_ship_combat(self) -> None:
+    def test_multi_ship_combat(self, client: TestClient) -> None:
         """Test combat with multiple ships on each side.
 
         Verifies:
@@ -516,8 +333,7 @@ class TestScenario3TwoShipLineBattle:
         initial_state = create_response.json()["state"]
 
         ships = initial_state["ships"]
-        p1_ships = [s for s in ships.values() if s["side"] == "P1"]
-        p2_ships = [s for s in ships.values() if s["side"] == "P2"]
+        p1_ships, p2_ships = split_ships(ships)
 
         turn_num = 1
 
@@ -526,12 +342,8 @@ class TestScenario3TwoShipLineBattle:
         p2_orders = [{"ship_id": s["id"], "movement_string": "3"} for s in p2_ships]
 
         client.post(
-            f"/games/{game_id}/turns/{turn_num}/orders",
-            json={"side": "P1", "orders": p1_orders},
-        )
-        client.post(
-            f"/games/{game_id}/turns/{turn_num}/orders",
-            json={"side": "P2", "orders": p2_orders},
+            f"/games/{game_id}/turns/{turn_num}/orders/batch",
+            json={"p1_orders": p1_orders, "p2_orders": p2_orders},
         )
 
         client.post(f"/games/{game_id}/turns/{turn_num}/ready", json={"side": "P1"})
@@ -578,83 +390,56 @@ class TestScenario3TwoShipLineBattle:
 class TestVictoryConditions:
     """Test that victory conditions are checked and triggered correctly."""
 
-    def test_victory_by_ship_struck(self) -> None:
-        """Test that game ends when a ship strikes.
+    def test_victory_by_ship_struck(self, client: TestClient) -> None:
+        """Test that the game ends as soon as a ship strikes.
 
-        Note: This test doesn't guarantee a ship will strike in the turns simulated,
-        but it verifies the system correctly checks and reports victory conditions.
+        The seeded duel is played until the frigates are abeam. The target's hull is
+        then set to zero, so the first broadside strikes it.
         """
-        # Create frigate duel game (first_struck victory)
         create_response = client.post(
             "/games",
-            json={"scenario_id": "mvp_frigate_duel_v1"},
+            json={"scenario_id": "mvp_frigate_duel_v1", "seed": 42},
         )
+        game_id = create_response.json()["game_id"]
         game_state = create_response.json()["state"]
-
-        # Game should not be ended initially
         assert game_state["game_ended"] is False
         assert game_state["winner"] is None
+        (p1_ship,), (p2_ship,) = split_ships(game_state["ships"])
+        p1_ship_id, p2_ship_id = p1_ship["id"], p2_ship["id"]
 
-        # The game will check victory after combat and reload phases
-        # We verify that if a ship strikes, the game ends
-        # (Actual striking depends on combat resolution and dice rolls)
-
-    def test_turn_limit_not_exceeded(self) -> None:
-        """Test that games respect turn limits from scenarios.
-
-        Verifies:
-        - Turn number increments correctly
-        - Game doesn't exceed scenario turn limit
-        """
-        # Create game with turn limit
-        create_response = client.post(
-            "/games",
-            json={"scenario_id": "mvp_frigate_duel_v1"},
-        )
-        game_id = create_response.json()["game_id"]
-        initial_state = create_response.json()["state"]
-
-        ships = initial_state["ships"]
-        p1_ship_id = next(s["id"] for s in ships.values() if s["side"] == "P1")
-        p2_ship_id = next(s["id"] for s in ships.values() if s["side"] == "P2")
-
-        # Run multiple turns
-        for turn_num in range(1, 6):
-            # Submit orders
+        # Turn 1 closes the distance; turn 2 brings P1's L broadside to bear
+        for turn_num, p1_move, p2_move in ((1, "2", "2"), (2, "R1", "L1")):
             client.post(
-                f"/games/{game_id}/turns/{turn_num}/orders",
-                json={"side": "P1", "orders": [{"ship_id": p1_ship_id, "movement_string": "0"}]},
+                f"/games/{game_id}/turns/{turn_num}/orders/batch",
+                json={
+                    "p1_orders": [{"ship_id": p1_ship_id, "movement_string": p1_move}],
+                    "p2_orders": [{"ship_id": p2_ship_id, "movement_string": p2_move}],
+                },
             )
-            client.post(
-                f"/games/{game_id}/turns/{turn_num}/orders",
-                json={"side": "P2", "orders": [{"ship_id": p2_ship_id, "movement_string": "0"}]},
-            )
-
-            # Mark ready
             client.post(f"/games/{game_id}/turns/{turn_num}/ready", json={"side": "P1"})
             client.post(f"/games/{game_id}/turns/{turn_num}/ready", json={"side": "P2"})
+            client.post(f"/games/{game_id}/turns/{turn_num}/resolve/movement", params=NO_LOG)
+            if turn_num == 1:
+                client.post(f"/games/{game_id}/turns/1/resolve/reload", params=NO_LOG)
+                client.post(f"/games/{game_id}/turns/1/advance", params=NO_LOG)
+
+        with mutate_game(game_id) as game:
+            assert game.turn_number == 2
+            game.ships[p2_ship_id].hull = 0
+
+        fire_response = client.post(
+            f"/games/{game_id}/turns/2/combat/fire",
+            json={
+                "ship_id": p1_ship_id,
+                "broadside": "L",
+                "target_ship_id": p2_ship_id,
+                "aim": "hull",
+            },
+        )
 
-            # Resolve movement
-            client.post(f"/games/{game_id}/turns/{turn_num}/resolve/movement")
-
-            # Reload
-            client.post(f"/games/{game_id}/turns/{turn_num}/resolve/reload")
-
-            # Check if game ended
-            game_response = client.get(f"/games/{game_id}")
-            game_state = game_response.json()
-
-            if game_state["game_ended"]:
-                # Game ended, verify it was due to turn limit or victory
-                break
-
-            # Advance turn if game hasn't ended
-            if not game_state["game_ended"]:
-                client.post(f"/games/{game_id}/turns/{turn_num}/advance")
-
-        # Final verification
-        final_game = client.get(f"/games/{game_id}")
-        final_state = final_game.json()
-
-        # Verify turn number is reasonable
-        assert final_state["turn_number"] <= 20  # Scenario turn limit
+        assert fire_response.status_code == 200
+        game_state = fire_response.json()["state"]
+        assert game_state["ships"][p2_ship_id]["struck"] is True
+        assert game_state["game_ended"] is True
+        assert game_state["winner"] == "P1"
+        assert game_state["event_log"][-1]["event_type"] == "game_end"
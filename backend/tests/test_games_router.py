@@ -1,50 +1,220 @@
 """Comprehensive tests for games router endpoints."""
 
+import asyncio
+import json
+import os
+import shutil
+from collections import Counter
+from collections.abc import Callable, Coroutine
+from functools import cache
+from pathlib import Path
+from typing import Any
+
 import pytest
 from fastapi.testclient import TestClient
 
-from wsim_api.main import app
+from wsim_api.routers import games
 from wsim_api.store import get_game_store
-from wsim_core.models.common import GamePhase
+from wsim_core.models.common import Facing, GamePhase, LoadState
+from wsim_core.models.game import Game
+from wsim_core.models.hex import HexCoord
+from wsim_core.models.orders import ShipOrders, TurnOrders
+from wsim_core.models.scenario import Scenario
+
+from .helpers import (
+    error_detail,
+    mutate_game,
+    scenario_template,
+    ship_ids_by_side,
+    store_scenario_game,
+)
+
+pytestmark = pytest.mark.usefixtures("reset_game_store")
+
+# Type of the handler_error fixture: await a handler coroutine, expect an HTTP error status
+HandlerError = Callable[[Coroutine[Any, Any, Any], int], str]
+
+
+def create_test_game(scenario_id: str = "mvp_frigate_duel_v1") -> dict:
+    """Store a fresh scenario game and return it shaped like a create-game response."""
+    game = store_scenario_game(scenario_id)
+    return {"game_id": game.id, "state": game.model_dump(mode="json")}
+
+
+@pytest.fixture(scope="class")
+def shared_unplayed_game() -> Game:
+    """Fork one unplayed Frigate Duel game per test class, for tests that never change it."""
+    return scenario_template("mvp_frigate_duel_v1").fork("shared-unplayed")
+
+
+@pytest.fixture
+def unplayed_game_id(reset_game_store: None, shared_unplayed_game: Game) -> str:
+    """Put the class's shared unplayed game back into the emptied store and return its ID.
+
+    Only for tests whose requests are rejected before the game is changed.
+    """
+    get_game_store().create_game(shared_unplayed_game)
+    return shared_unplayed_game.id
+
+
+@pytest.fixture(scope="module")
+def combat_phase_template(async_runner: asyncio.Runner) -> Game:
+    """Play a Frigate Duel game to the combat phase once for this module, without HTTP."""
+    game_id = create_test_game()["game_id"]
+    prime_orders_submitted(game_id)
+    async_runner.run(games.resolve_movement(game_id, 1))
+    return get_game_store().get_game(game_id).fork("template")
 
-client = TestClient(app)
 
+@pytest.fixture(scope="module")
+def duel_ship_ids() -> tuple[str, str]:
+    """IDs of the Frigate Duel's P1 and P2 ships, fixed by the scenario."""
+    ids = ship_ids_by_side("mvp_frigate_duel_v1")
+    (p1_ship_id,) = ids["P1"]
+    (p2_ship_id,) = ids["P2"]
+    return p1_ship_id, p2_ship_id
 
-@pytest.fixture(autouse=True)
-def reset_game_store() -> None:
-    """Reset game store before each test."""
+
+@pytest.fixture
+def combat_game(combat_phase_template: Game) -> tuple[str, dict]:
+    """Store a copy of the combat-phase game and return its ID and state."""
     store = get_game_store()
-    # Clear all games
-    for game in list(store.list_games()):
-        store.delete_game(game.id)
+    game = combat_phase_template.fork(store.generate_game_id())
+    store.create_game(game)
+    return game.id, game.model_dump(mode="json")
 
 
-def create_test_game() -> dict:
-    """Helper to create a test game and return response data."""
-    response = client.post(
-        "/games",
-        json={"scenario_id": "mvp_frigate_duel_v1"},
-    )
-    assert response.status_code == 201
-    return response.json()
+@cache
+def _default_orders(scenario_id: str, side: str) -> tuple[dict, ...]:
+    """Build the "2" movement orders for a side once per scenario (the roster is static)."""
+    ship_ids = ship_ids_by_side(scenario_id)[side]
+    return tuple({"ship_id": ship_id, "movement_string": "2"} for ship_id in ship_ids)
 
 
 def get_ship_orders(game_state: dict, side: str) -> list[dict]:
-    """Helper to create basic movement orders for all ships on a side."""
-    ships = [ship for ship in game_state["ships"].values() if ship["side"] == side]
-    return [
-        {
-            "ship_id": ship["id"],
-            "movement_string": "2",
-        }
-        for ship in ships
-    ]
+    """Helper to create basic movement orders for all ships on a side.
+
+    The order dicts are shared between calls; copy them before modifying.
+    """
+    return list(_default_orders(game_state["scenario_id"], side))
+
+
+def prime_orders_submitted(game_id: str) -> None:
+    """Record default orders for both sides directly in the store, skipping the orders endpoint.
+
+    Only for tests that need orders in place; TestSubmitOrders covers the endpoint itself.
+    """
+    with mutate_game(game_id) as game:
+        for side in ("P1", "P2"):
+            turn_orders = TurnOrders(
+                turn_number=game.turn_number,
+                side=side,
+                orders=[
+                    ShipOrders.model_construct(**o) for o in _default_orders(game.scenario_id, side)
+                ],
+                submitted=True,
+            )
+            if side == "P1":
+                game.p1_orders = turn_orders
+            else:
+                game.p2_orders = turn_orders
+
+
+def place_abeam(game: Game, ship_id: str, target_id: str) -> None:
+    """Move two ships so the target is the only legal target of the first ship's L broadside.
+
+    The ship faces east mid-map and the target lies three hexes to its north, facing west.
+    """
+    ship, target = game.ships[ship_id], game.ships[target_id]
+    ship.bow_hex = HexCoord(col=10, row=10)
+    ship.stern_hex = HexCoord(col=9, row=10)
+    ship.facing = Facing.E
+    target.bow_hex = HexCoord(col=10, row=7)
+    target.stern_hex = HexCoord(col=11, row=7)
+    target.facing = Facing.W
+
+
+# Handlers that act on a specific turn, called as (game_id, turn). Each looks up the
+# game first and checks the turn before the phase, so one planning-phase game covers all.
+TURN_ACTIONS = [
+    pytest.param(
+        lambda game_id, turn: games.submit_orders(
+            game_id, turn, games.SubmitOrdersRequest(side="P1", orders=[])
+        ),
+        id="submit_orders",
+    ),
+    pytest.param(
+        lambda game_id, turn: games.submit_all_orders(
+            game_id, turn, games.SubmitAllOrdersRequest(p1_orders=[], p2_orders=[])
+        ),
+        id="submit_all_orders",
+    ),
+    pytest.param(
+        lambda game_id, turn: games.mark_ready(game_id, turn, games.MarkReadyRequest(side="P1")),
+        id="mark_ready",
+    ),
+    pytest.param(games.resolve_movement, id="resolve_movement"),
+    pytest.param(
+        lambda game_id, turn: games.fire_broadside(
+            game_id,
+            turn,
+            games.FireBroadsideRequest(
+                ship_id="ship1", broadside="L", target_ship_id="ship2", aim="hull"
+            ),
+        ),
+        id="fire_broadside",
+    ),
+    pytest.param(games.resolve_reload, id="resolve_reload"),
+    pytest.param(games.advance_turn, id="advance_turn"),
+]
+
+# Handlers that only look up a game, called as (game_id)
+GAME_LOOKUPS = [
+    pytest.param(games.get_game, id="get_game"),
+    pytest.param(games.delete_game, id="delete_game"),
+    pytest.param(
+        lambda game_id: games.get_broadside_arc_info(game_id, "ship1", "L"),
+        id="get_broadside_arc_info",
+    ),
+    pytest.param(games.get_all_broadside_arcs, id="get_all_broadside_arcs"),
+]
+
+
+class TestEndpointErrors:
+    """Error paths shared by every game endpoint, checked by awaiting the handlers."""
+
+    @pytest.mark.parametrize("action", TURN_ACTIONS)
+    def test_turn_action_game_not_found(
+        self, action: Callable[[str, int], Coroutine[Any, Any, Any]], handler_error: HandlerError
+    ) -> None:
+        """Test each turn action returns 404 for a non-existent game."""
+        detail = handler_error(action("nonexistent", 1), 404)
+        assert "not found" in detail.lower()
+
+    @pytest.mark.parametrize("lookup", GAME_LOOKUPS)
+    def test_game_lookup_not_found(
+        self, lookup: Callable[[str], Coroutine[Any, Any, Any]], handler_error: HandlerError
+    ) -> None:
+        """Test each game lookup returns 404 for a non-existent game."""
+        detail = handler_error(lookup("nonexistent"), 404)
+        assert "not found" in detail.lower()
+
+    @pytest.mark.parametrize("action", TURN_ACTIONS)
+    def test_turn_mismatch(
+        self,
+        action: Callable[[str, int], Coroutine[Any, Any, Any]],
+        handler_error: HandlerError,
+        unplayed_game_id: str,
+    ) -> None:
+        """Test each turn action rejects a turn number other than the game's current turn."""
+        detail = handler_error(action(unplayed_game_id, 99), 400)
+        assert "turn mismatch" in detail.lower()
 
 
 class TestSubmitOrders:
     """Tests for submit_orders endpoint."""
 
-    def test_submit_orders_success(self) -> None:
+    def test_submit_orders_success(self, client: TestClient) -> None:
         """Test successfully submitting orders for a player."""
         game_data = create_test_game()
         game_id = game_data["game_id"]
@@ -62,31 +232,7 @@ class TestSubmitOrders:
         assert data["state"]["p1_orders"] is not None
         assert data["state"]["p1_orders"]["submitted"] is True
 
-    def test_submit_orders_game_not_found(self) -> None:
-        """Test submitting orders for non-existent game."""
-        response = client.post(
-            "/games/nonexistent/turns/1/orders",
-            json={"side": "P1", "orders": []},
-        )
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
-
-    def test_submit_orders_turn_mismatch(self) -> None:
-        """Test submitting orders for wrong turn number."""
-        game_data = create_test_game()
-        game_id = game_data["game_id"]
-        game_state = game_data["state"]
-
-        orders = get_ship_orders(game_state, "P1")
-        response = client.post(
-            f"/games/{game_id}/turns/99/orders",
-            json={"side": "P1", "orders": orders},
-        )
-
-        assert response.status_code == 400
-        assert "turn mismatch" in response.json()["detail"].lower()
-
-    def test_submit_orders_invalid_phase(self) -> None:
+    def test_submit_orders_invalid_phase(self, client: TestClient) -> None:
         """Test submitting orders in wrong game phase."""
         game_data = create_test_game()
         game_id = game_data["game_id"]
@@ -110,67 +256,100 @@ class TestSubmitOrders:
             json={"side": "P1", "orders": orders},
         )
 
-        assert response.status_code == 400
-        assert "cannot submit orders" in response.json()["detail"].lower()
+        assert "cannot submit orders" in error_detail(response, 400).lower()
 
-    def test_submit_orders_invalid_ship_ids(self) -> None:
+    def test_submit_orders_invalid_ship_ids(
+        self, client: TestClient, unplayed_game_id: str
+    ) -> None:
         """Test submitting orders for ships not belonging to player."""
-        game_data = create_test_game()
-        game_id = game_data["game_id"]
-        game_state = game_data["state"]
-
         # Try to submit orders for P2's ships as P1
-        p2_ships = [s for s in game_state["ships"].values() if s["side"] == "P2"]
-        orders = [
-            {
-                "ship_id": ship["id"],
-                "movement_string": "2",
-            }
-            for ship in p2_ships
-        ]
+        p2_ids = ship_ids_by_side("mvp_frigate_duel_v1")["P2"]
+        orders = [{"ship_id": ship_id, "movement_string": "2"} for ship_id in p2_ids]
 
         response = client.post(
-            f"/games/{game_id}/turns/1/orders",
+            f"/games/{unplayed_game_id}/turns/1/orders",
             json={"side": "P1", "orders": orders},
         )
 
-        assert response.status_code == 400
-        assert "invalid ship ids" in response.json()["detail"].lower()
+        assert "invalid ship ids" in error_detail(response, 400).lower()
 
-    def test_submit_orders_missing_ships(self) -> None:
+    def test_submit_orders_missing_ships(self, client: TestClient) -> None:
         """Test submitting incomplete orders (missing some ships)."""
         # Use two-ship scenario to test incomplete orders
-        response = client.post(
-            "/games",
-            json={"scenario_id": "mvp_two_ship_line_battle_v1"},
-        )
-        assert response.status_code == 201
-        game_data = response.json()
+        game_data = create_test_game("mvp_two_ship_line_battle_v1")
         game_id = game_data["game_id"]
         game_state = game_data["state"]
 
         # Only submit orders for first ship, omit others
-        p1_ships = [s for s in game_state["ships"].values() if s["side"] == "P1"]
-        orders = [
-            {
-                "ship_id": p1_ships[0]["id"],
-                "movement_string": "2",
-            }
-        ]
+        p1_ids = ship_ids_by_side(game_state["scenario_id"])["P1"]
+        orders = [{"ship_id": p1_ids[0], "movement_string": "2"}]
 
         response = client.post(
             f"/games/{game_id}/turns/1/orders",
             json={"side": "P1", "orders": orders},
         )
 
-        assert response.status_code == 400
-        assert "missing orders" in response.json()["detail"].lower()
+        assert "missing orders" in error_detail(response, 400).lower()
+
+
+class TestSubmitAllOrders:
+    """Tests for the batched submit_all_orders endpoint."""
+
+    def test_submit_all_orders_success(self, client: TestClient) -> None:
+        """Test submitting both sides' orders in one request."""
+        game_id = create_test_game()["game_id"]
+        p1_orders = _default_orders("mvp_frigate_duel_v1", "P1")
+        p2_orders = _default_orders("mvp_frigate_duel_v1", "P2")
+
+        response = client.post(
+            f"/games/{game_id}/turns/1/orders/batch",
+            json={"p1_orders": p1_orders, "p2_orders": p2_orders},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["orders_submitted"] is True
+        for side, orders in (("p1_orders", p1_orders), ("p2_orders", p2_orders)):
+            assert data["state"][side]["submitted"] is True
+            assert data["state"][side]["ready"] is False
+            assert [o["ship_id"] for o in data["state"][side]["orders"]] == [
+                o["ship_id"] for o in orders
+            ]
+
+    def test_submit_all_orders_rejects_both_on_invalid_side(
+        self, client: TestClient, unplayed_game_id: str
+    ) -> None:
+        """Test that invalid P2 orders reject the request without recording P1's orders."""
+        p1_orders = _default_orders("mvp_frigate_duel_v1", "P1")
+
+        response = client.post(
+            f"/games/{unplayed_game_id}/turns/1/orders/batch",
+            json={"p1_orders": p1_orders, "p2_orders": p1_orders},
+        )
+
+        assert "invalid ship ids for p2" in error_detail(response, 400).lower()
+        game = get_game_store().get_game(unplayed_game_id)
+        assert game.p1_orders is None
+        assert game.p2_orders is None
+
+    def test_submit_all_orders_invalid_phase(
+        self, client: TestClient, combat_game: tuple[str, dict]
+    ) -> None:
+        """Test submitting both sides' orders outside the planning phase."""
+        game_id, _ = combat_game
+
+        response = client.post(
+            f"/games/{game_id}/turns/1/orders/batch",
+            json={"p1_orders": [], "p2_orders": []},
+        )
+
+        assert "cannot submit orders" in error_detail(response, 400).lower()
 
 
 class TestMarkReady:
     """Tests for mark_ready endpoint."""
 
-    def test_mark_ready_success(self) -> None:
+    def test_mark_ready_success(self, client: TestClient) -> None:
         """Test successfully marking a player as ready."""
         game_data = create_test_game()
         game_id = game_data["game_id"]
@@ -194,19 +373,13 @@ class TestMarkReady:
         assert data["ready"] is True
         assert data["both_ready"] is False  # P2 hasn't submitted yet
 
-    def test_mark_ready_both_players(self) -> None:
+    def test_mark_ready_both_players(self, client: TestClient) -> None:
         """Test marking both players as ready."""
         game_data = create_test_game()
         game_id = game_data["game_id"]
-        game_state = game_data["state"]
 
         # Submit orders for both players
-        for side in ["P1", "P2"]:
-            orders = get_ship_orders(game_state, side)
-            client.post(
-                f"/games/{game_id}/turns/1/orders",
-                json={"side": side, "orders": orders},
-            )
+        prime_orders_submitted(game_id)
 
         # Mark P1 as ready
         client.post(
@@ -224,47 +397,13 @@ class TestMarkReady:
         data = response.json()
         assert data["both_ready"] is True
 
-    def test_mark_ready_game_not_found(self) -> None:
-        """Test marking ready for non-existent game."""
-        response = client.post(
-            "/games/nonexistent/turns/1/ready",
-            json={"side": "P1"},
-        )
-        assert response.status_code == 404
-
-    def test_mark_ready_turn_mismatch(self) -> None:
-        """Test marking ready for wrong turn number."""
-        game_data = create_test_game()
-        game_id = game_data["game_id"]
-        game_state = game_data["state"]
-
-        orders = get_ship_orders(game_state, "P1")
-        client.post(
-            f"/games/{game_id}/turns/1/orders",
-            json={"side": "P1", "orders": orders},
-        )
-
-        response = client.post(
-            f"/games/{game_id}/turns/99/ready",
-            json={"side": "P1"},
-        )
-
-        assert response.status_code == 400
-        assert "turn mismatch" in response.json()["detail"].lower()
-
-    def test_mark_ready_invalid_phase(self) -> None:
+    def test_mark_ready_invalid_phase(self, client: TestClient) -> None:
         """Test marking ready in wrong game phase."""
         game_data = create_test_game()
         game_id = game_data["game_id"]
-        game_state = game_data["state"]
 
         # Submit orders and resolve movement
-        for side in ["P1", "P2"]:
-            orders = get_ship_orders(game_state, side)
-            client.post(
-                f"/games/{game_id}/turns/1/orders",
-                json={"side": side, "orders": orders},
-            )
+        prime_orders_submitted(game_id)
 
         client.post(f"/games/{game_id}/turns/1/resolve/movement")
 
@@ -274,39 +413,28 @@ class TestMarkReady:
             json={"side": "P1"},
         )
 
-        assert response.status_code == 400
-        assert "cannot mark ready" in response.json()["detail"].lower()
+        assert "cannot mark ready" in error_detail(response, 400).lower()
 
-    def test_mark_ready_without_orders(self) -> None:
+    def test_mark_ready_without_orders(self, client: TestClient, unplayed_game_id: str) -> None:
         """Test marking ready without submitting orders first."""
-        game_data = create_test_game()
-        game_id = game_data["game_id"]
-
         response = client.post(
-            f"/games/{game_id}/turns/1/ready",
+            f"/games/{unplayed_game_id}/turns/1/ready",
             json={"side": "P1"},
         )
 
-        assert response.status_code == 400
-        assert "not submitted orders" in response.json()["detail"].lower()
+        assert "not submitted orders" in error_detail(response, 400).lower()
 
 
 class TestResolveMovement:
     """Tests for resolve_movement endpoint."""
 
-    def test_resolve_movement_success(self) -> None:
+    def test_resolve_movement_success(self, client: TestClient) -> None:
         """Test successfully resolving movement."""
         game_data = create_test_game()
         game_id = game_data["game_id"]
-        game_state = game_data["state"]
 
         # Submit orders for both players
-        for side in ["P1", "P2"]:
-            orders = get_ship_orders(game_state, side)
-            client.post(
-                f"/games/{game_id}/turns/1/orders",
-                json={"side": side, "orders": orders},
-            )
+        prime_orders_submitted(game_id)
 
         # Resolve movement
         response = client.post(f"/games/{game_id}/turns/1/resolve/movement")
@@ -316,50 +444,40 @@ class TestResolveMovement:
         assert data["state"]["phase"] == "combat"
         assert len(data["events"]) > 0
 
-    def test_resolve_movement_game_not_found(self) -> None:
-        """Test resolving movement for non-existent game."""
-        response = client.post("/games/nonexistent/turns/1/resolve/movement")
-        assert response.status_code == 404
-
-    def test_resolve_movement_turn_mismatch(self) -> None:
-        """Test resolving movement for wrong turn."""
+    def test_resolve_movement_without_event_log(self, client: TestClient) -> None:
+        """Test include_log=false omits the log from the response but not the stored game."""
         game_data = create_test_game()
         game_id = game_data["game_id"]
-        game_state = game_data["state"]
 
-        for side in ["P1", "P2"]:
-            orders = get_ship_orders(game_state, side)
-            client.post(
-                f"/games/{game_id}/turns/1/orders",
-                json={"side": side, "orders": orders},
-            )
+        prime_orders_submitted(game_id)
 
-        response = client.post(f"/games/{game_id}/turns/99/resolve/movement")
-        assert response.status_code == 400
-        assert "turn mismatch" in response.json()["detail"].lower()
+        response = client.post(
+            f"/games/{game_id}/turns/1/resolve/movement", params={"include_log": "false"}
+        )
 
-    def test_resolve_movement_invalid_phase(self) -> None:
+        assert response.status_code == 200
+        data = response.json()
+        assert data["state"]["event_log"] == []
+        assert len(data["events"]) > 0
+
+        stored = client.get(f"/games/{game_id}").json()
+        assert stored["event_log"] == data["events"]
+
+    def test_resolve_movement_invalid_phase(self, client: TestClient) -> None:
         """Test resolving movement in wrong phase."""
         game_data = create_test_game()
         game_id = game_data["game_id"]
-        game_state = game_data["state"]
 
         # Submit orders and resolve once
-        for side in ["P1", "P2"]:
-            orders = get_ship_orders(game_state, side)
-            client.post(
-                f"/games/{game_id}/turns/1/orders",
-                json={"side": side, "orders": orders},
-            )
+        prime_orders_submitted(game_id)
 
         client.post(f"/games/{game_id}/turns/1/resolve/movement")
 
         # Try to resolve again in combat phase
         response = client.post(f"/games/{game_id}/turns/1/resolve/movement")
-        assert response.status_code == 400
-        assert "cannot resolve movement" in response.json()["detail"].lower()
+        assert "cannot resolve movement" in error_detail(response, 400).lower()
 
-    def test_resolve_movement_p1_orders_missing(self) -> None:
+    def test_resolve_movement_p1_orders_missing(self, client: TestClient) -> None:
         """Test resolving movement when P1 hasn't submitted orders."""
         game_data = create_test_game()
         game_id = game_data["game_id"]
@@ -373,11 +491,11 @@ class TestResolveMovement:
         )
 
         response = client.post(f"/games/{game_id}/turns/1/resolve/movement")
-        assert response.status_code == 400
-        assert "p1" in response.json()["detail"].lower()
-        assert "not submitted" in response.json()["detail"].lower()
+        detail = error_detail(response, 400).lower()
+        assert "p1" in detail
+        assert "not submitted" in detail
 
-    def test_resolve_movement_p2_orders_missing(self) -> None:
+    def test_resolve_movement_p2_orders_missing(self, client: TestClient) -> None:
         """Test resolving movement when P2 hasn't submitted orders."""
         game_data = create_test_game()
         game_id = game_data["game_id"]
@@ -391,11 +509,11 @@ class TestResolveMovement:
         )
 
         response = client.post(f"/games/{game_id}/turns/1/resolve/movement")
-        assert response.status_code == 400
-        assert "p2" in response.json()["detail"].lower()
-        assert "not submitted" in response.json()["detail"].lower()
+        detail = error_detail(response, 400).lower()
+        assert "p2" in detail
+        assert "not submitted" in detail
 
-    def test_resolve_movement_invalid_movement_string(self) -> None:
+    def test_resolve_movement_invalid_movement_string(self, client: TestClient) -> None:
         """Test resolving movement with invalid movement notation."""
         game_data = create_test_game()
         game_id = game_data["game_id"]
@@ -409,13 +527,11 @@ class TestResolveMovement:
         )
 
         # Submit invalid P2 orders
-        p2_ships = [s for s in game_state["ships"].values() if s["side"] == "P2"]
+        p2_ids = ship_ids_by_side(game_state["scenario_id"])["P2"]
         bad_orders = [
-            {
-                "ship_id": ship["id"],
-                "movement_string": "999",  # Invalid: exceeds battle sail speed
-            }
-            for ship in p2_ships
+            # Invalid: exceeds battle sail speed
+            {"ship_id": ship_id, "movement_string": "999"}
+            for ship_id in p2_ids
         ]
         client.post(
             f"/games/{game_id}/turns/1/orders",
@@ -423,118 +539,41 @@ class TestResolveMovement:
         )
 
         response = client.post(f"/games/{game_id}/turns/1/resolve/movement")
-        assert response.status_code == 400
-        assert "invalid movement" in response.json()["detail"].lower()
+        assert "invalid movement" in error_detail(response, 400).lower()
 
 
 class TestFireBroadside:
     """Tests for fire_broadside endpoint."""
 
-    def setup_combat_phase(self) -> tuple[str, dict]:
-        """Helper to set up a game in combat phase with ships ready to fire."""
-        game_data = create_test_game()
-        game_id = game_data["game_id"]
-        game_state = game_data["state"]
-
-        # Submit orders and resolve movement
-        for side in ["P1", "P2"]:
-            orders = get_ship_orders(game_state, side)
-            client.post(
-                f"/games/{game_id}/turns/1/orders",
-                json={"side": side, "orders": orders},
-            )
-
-        client.post(f"/games/{game_id}/turns/1/resolve/movement")
-
-        # Get updated game state
-        response = client.get(f"/games/{game_id}")
-        game_state = response.json()
-
-        return game_id, game_state
-
-    def test_fire_broadside_game_not_found(self) -> None:
-        """Test firing broadside for non-existent game."""
-        response = client.post(
-            "/games/nonexistent/turns/1/combat/fire",
-            json={
-                "ship_id": "ship1",
-                "broadside": "L",
-                "target_ship_id": "ship2",
-                "aim": "hull",
-            },
-        )
-        assert response.status_code == 404
-
-    def test_fire_broadside_turn_mismatch(self) -> None:
-        """Test firing broadside for wrong turn."""
-        game_id, game_state = self.setup_combat_phase()
-        ships = list(game_state["ships"].values())
-        ship = ships[0]
-        target = ships[1]
-
-        response = client.post(
-            f"/games/{game_id}/turns/99/combat/fire",
-            json={
-                "ship_id": ship["id"],
-                "broadside": "L",
-                "target_ship_id": target["id"],
-                "aim": "hull",
-            },
-        )
-        assert response.status_code == 400
-        assert "turn mismatch" in response.json()["detail"].lower()
-
-    def test_fire_broadside_invalid_phase(self) -> None:
+    def test_fire_broadside_invalid_phase(
+        self, client: TestClient, duel_ship_ids: tuple[str, str]
+    ) -> None:
         """Test firing broadside in wrong phase."""
         game_data = create_test_game()
         game_id = game_data["game_id"]
-        game_state = game_data["state"]
-        ships = list(game_state["ships"].values())
-        ship = ships[0]
-        target = ships[1]
+        ship_id, target_id = duel_ship_ids
 
         # Try to fire in planning phase
         response = client.post(
             f"/games/{game_id}/turns/1/combat/fire",
             json={
-                "ship_id": ship["id"],
+                "ship_id": ship_id,
                 "broadside": "L",
-                "target_ship_id": target["id"],
+                "target_ship_id": target_id,
                 "aim": "hull",
             },
         )
-        assert response.status_code == 400
-        assert "cannot fire" in response.json()["detail"].lower()
+        assert "cannot fire" in error_detail(response, 400).lower()
 
 
 class TestResolveReload:
     """Tests for resolve_reload endpoint."""
 
-    def setup_reload_phase(self) -> tuple[str, dict]:
-        """Helper to set up a game ready for reload phase."""
-        game_data = create_test_game()
-        game_id = game_data["game_id"]
-        game_state = game_data["state"]
-
-        # Submit orders and resolve movement
-        for side in ["P1", "P2"]:
-            orders = get_ship_orders(game_state, side)
-            client.post(
-                f"/games/{game_id}/turns/1/orders",
-                json={"side": side, "orders": orders},
-            )
-
-        client.post(f"/games/{game_id}/turns/1/resolve/movement")
-
-        # Get updated game state
-        response = client.get(f"/games/{game_id}")
-        game_state = response.json()
-
-        return game_id, game_state
-
-    def test_resolve_reload_success(self) -> None:
+    def test_resolve_reload_success(
+        self, client: TestClient, combat_game: tuple[str, dict]
+    ) -> None:
         """Test successfully resolving reload phase."""
-        game_id, game_state = self.setup_reload_phase()
+        game_id, game_state = combat_game
 
         response = client.post(f"/games/{game_id}/turns/1/resolve/reload")
 
@@ -542,58 +581,19 @@ class TestResolveReload:
         data = response.json()
         assert len(data["events"]) >= 0  # May have reload events
 
-    def test_resolve_reload_game_not_found(self) -> None:
-        """Test resolving reload for non-existent game."""
-        response = client.post("/games/nonexistent/turns/1/resolve/reload")
-        assert response.status_code == 404
-
-    def test_resolve_reload_turn_mismatch(self) -> None:
-        """Test resolving reload for wrong turn."""
-        game_id, _ = self.setup_reload_phase()
-
-        response = client.post(f"/games/{game_id}/turns/99/resolve/reload")
-        assert response.status_code == 400
-        assert "turn mismatch" in response.json()["detail"].lower()
-
-    def test_resolve_reload_invalid_phase(self) -> None:
+    def test_resolve_reload_invalid_phase(self, client: TestClient, unplayed_game_id: str) -> None:
         """Test resolving reload in wrong phase."""
-        game_data = create_test_game()
-        game_id = game_data["game_id"]
-
         # Try to reload in planning phase
-        response = client.post(f"/games/{game_id}/turns/1/resolve/reload")
-        assert response.status_code == 400
-        assert "cannot reload" in response.json()["detail"].lower()
+        response = client.post(f"/games/{unplayed_game_id}/turns/1/resolve/reload")
+        assert "cannot reload" in error_detail(response, 400).lower()
 
 
 class TestAdvanceTurn:
     """Tests for advance_turn endpoint."""
 
-    def setup_end_of_turn(self) -> tuple[str, dict]:
-        """Helper to set up a game at end of combat phase."""
-        game_data = create_test_game()
-        game_id = game_data["game_id"]
-        game_state = game_data["state"]
-
-        # Submit orders and resolve movement
-        for side in ["P1", "P2"]:
-            orders = get_ship_orders(game_state, side)
-            client.post(
-                f"/games/{game_id}/turns/1/orders",
-                json={"side": side, "orders": orders},
-            )
-
-        client.post(f"/games/{game_id}/turns/1/resolve/movement")
-
-        # Get updated game state
-        response = client.get(f"/games/{game_id}")
-        game_state = response.json()
-
-        return game_id, game_state
-
-    def test_advance_turn_success(self) -> None:
+    def test_advance_turn_success(self, client: TestClient, combat_game: tuple[str, dict]) -> None:
         """Test successfully advancing to next turn."""
-        game_id, _ = self.setup_end_of_turn()
+        game_id, _ = combat_game
 
         # Resolve reload to get to RELOAD phase
         client.post(f"/games/{game_id}/turns/1/resolve/reload")
@@ -608,63 +608,25 @@ class TestAdvanceTurn:
         assert data["state"]["p1_orders"] is None
         assert data["state"]["p2_orders"] is None
 
-    def test_advance_turn_game_not_found(self) -> None:
-        """Test advancing turn for non-existent game."""
-        response = client.post("/games/nonexistent/turns/1/advance")
-        assert response.status_code == 404
-
-    def test_advance_turn_turn_mismatch(self) -> None:
-        """Test advancing turn with wrong turn number."""
-        game_id, _ = self.setup_end_of_turn()
-
-        response = client.post(f"/games/{game_id}/turns/99/advance")
-        assert response.status_code == 400
-        assert "turn mismatch" in response.json()["detail"].lower()
-
-    def test_advance_turn_invalid_phase(self) -> None:
+    def test_advance_turn_invalid_phase(self, client: TestClient, unplayed_game_id: str) -> None:
         """Test advancing turn in wrong phase."""
-        game_data = create_test_game()
-        game_id = game_data["game_id"]
-
         # Try to advance in planning phase
-        response = client.post(f"/games/{game_id}/turns/1/advance")
-        assert response.status_code == 400
-        assert "cannot advance" in response.json()["detail"].lower()
+        response = client.post(f"/games/{unplayed_game_id}/turns/1/advance")
+        assert "cannot advance" in error_detail(response, 400).lower()
 
 
 class TestGetBroadsideArc:
     """Tests for get_broadside_arc_info endpoint."""
 
-    def setup_combat_phase(self) -> tuple[str, dict]:
-        """Helper to set up a game in combat phase."""
-        game_data = create_test_game()
-        game_id = game_data["game_id"]
-        game_state = game_data["state"]
-
-        # Submit orders and resolve movement
-        for side in ["P1", "P2"]:
-            orders = get_ship_orders(game_state, side)
-            client.post(
-                f"/games/{game_id}/turns/1/orders",
-                json={"side": side, "orders": orders},
-            )
-
-        client.post(f"/games/{game_id}/turns/1/resolve/movement")
-
-        # Get updated game state
-        response = client.get(f"/games/{game_id}")
-        game_state = response.json()
-
-        return game_id, game_state
-
-    def test_get_broadside_arc_success(self) -> None:
+    def test_get_broadside_arc_success(
+        self, client: TestClient, combat_game: tuple[str, dict], duel_ship_ids: tuple[str, str]
+    ) -> None:
         """Test successfully getting broadside arc information."""
-        game_id, game_state = self.setup_combat_phase()
-        ships = list(game_state["ships"].values())
-        ship = ships[0]
+        game_id, _ = combat_game
+        ship_id, _ = duel_ship_ids
 
         response = client.get(
-            f"/games/{game_id}/ships/{ship['id']}/broadside/L/arc",
+            f"/games/{game_id}/ships/{ship_id}/broadside/L/arc",
         )
 
         assert response.status_code == 200
@@ -674,92 +636,80 @@ class TestGetBroadsideArc:
         assert "valid_targets" in data
         assert "closest_distance" in data
 
-    def test_get_broadside_arc_game_not_found(self) -> None:
-        """Test getting broadside arc for non-existent game."""
-        response = client.get(
-            "/games/nonexistent/ships/ship1/broadside/L/arc",
-        )
-        assert response.status_code == 404
-
-    def test_get_broadside_arc_ship_not_found(self) -> None:
+    def test_get_broadside_arc_ship_not_found(
+        self, combat_game: tuple[str, dict], handler_error: HandlerError
+    ) -> None:
         """Test getting broadside arc for non-existent ship."""
-        game_id, _ = self.setup_combat_phase()
+        game_id, _ = combat_game
 
-        response = client.get(
-            f"/games/{game_id}/ships/nonexistent_ship/broadside/L/arc",
-        )
-        assert response.status_code == 404
-        assert "ship" in response.json()["detail"].lower()
-        assert "not found" in response.json()["detail"].lower()
+        detail = handler_error(games.get_broadside_arc_info(game_id, "nonexistent_ship", "L"), 404)
+        assert "ship" in detail.lower()
+        assert "not found" in detail.lower()
+
+    def test_get_all_broadside_arcs_matches_single_arcs(
+        self, client: TestClient, combat_game: tuple[str, dict]
+    ) -> None:
+        """Test the batched arcs endpoint returns the same data as per-broadside calls."""
+        game_id, game_state = combat_game
+
+        response = client.get(f"/games/{game_id}/broadsides/arcs")
+
+        assert response.status_code == 200
+        arcs = response.json()["arcs"]
+        assert set(arcs) == set(game_state["ships"])
+        for ship_id, by_broadside in arcs.items():
+            assert set(by_broadside) == {"L", "R"}
+            for broadside, arc_data in by_broadside.items():
+                single = client.get(f"/games/{game_id}/ships/{ship_id}/broadside/{broadside}/arc")
+                assert arc_data == single.json()
 
 
 class TestCreateGameErrorHandling:
     """Tests for create_game error handling."""
 
-    def test_create_game_scenario_not_found(self) -> None:
+    def test_create_game_scenario_not_found(self, client: TestClient) -> None:
         """Test creating a game with a scenario that doesn't exist."""
         response = client.post(
             "/games",
             json={"scenario_id": "nonexistent_scenario_id"},
         )
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
+        assert "not found" in error_detail(response, 404).lower()
 
 
 class TestFireBroadsideErrorHandling:
     """Tests for fire_broadside error handling beyond basic validation."""
 
-    def setup_combat_phase(self) -> tuple[str, dict]:
-        """Helper to set up a game in combat phase with ships ready to fire."""
-        game_data = create_test_game()
-        game_id = game_data["game_id"]
-        game_state = game_data["state"]
-
-        # Submit orders and resolve movement
-        for side in ["P1", "P2"]:
-            orders = get_ship_orders(game_state, side)
-            client.post(
-                f"/games/{game_id}/turns/1/orders",
-                json={"side": side, "orders": orders},
-            )
-
-        client.post(f"/games/{game_id}/turns/1/resolve/movement")
-
-        # Get updated game state
-        response = client.get(f"/games/{game_id}")
-        game_state = response.json()
-
-        return game_id, game_state
-
-    def test_fire_broadside_ship_not_found(self) -> None:
+    def test_fire_broadside_ship_not_found(
+        self, client: TestClient, combat_game: tuple[str, dict], duel_ship_ids: tuple[str, str]
+    ) -> None:
         """Test firing with a non-existent ship ID."""
-        game_id, game_state = self.setup_combat_phase()
-        ships = list(game_state["ships"].values())
-        target = ships[0]
+        game_id, _ = combat_game
+        target_id, _ = duel_ship_ids
 
         response = client.post(
             f"/games/{game_id}/turns/1/combat/fire",
             json={
                 "ship_id": "nonexistent_ship_id",
                 "broadside": "L",
-                "target_ship_id": target["id"],
+                "target_ship_id": target_id,
                 "aim": "hull",
             },
         )
-        assert response.status_code == 404
-        assert "ship" in response.json()["detail"].lower()
-        assert "not found" in response.json()["detail"].lower()
+        detail = error_detail(response, 404).lower()
+        assert "ship" in detail
+        assert "not found" in detail
 
-    def test_fire_broadside_target_not_found(self) -> None:
+    def test_fire_broadside_target_not_found(
+        self, client: TestClient, combat_game: tuple[str, dict], duel_ship_ids: tuple[str, str]
+    ) -> None:
         """Test firing at a non-existent target ID."""
-        game_id, game_state = self.setup_combat_phase()
-        ships = list(game_state["ships"].values())
-        ship = ships[0]
+        game_id, _ = combat_game
+        ship_id, _ = duel_ship_ids
 
         response = client.post(
             f"/games/{game_id}/turns/1/combat/fire",
             json={
-                "ship_id": ship["id"],
+                "ship_id": ship_id,
                 "broadside": "L",
                 "target_ship_id": "nonexistent_target_id",
                 "aim": "hull",
@@ -769,25 +719,23 @@ class TestFireBroadsideErrorHandling:
         # or not found - depends on the path taken
         assert response.status_code in [400, 404]
 
-    def test_fire_broadside_no_legal_targets(self) -> None:
+    def test_fire_broadside_no_legal_targets(
+        self, client: TestClient, combat_game: tuple[str, dict]
+    ) -> None:
         """Test firing when there are no legal targets in broadside arc."""
-        game_id, game_state = self.setup_combat_phase()
+        game_id, game_state = combat_game
 
-        # Get P1 ships
-        p1_ships = [s for s in game_state["ships"].values() if s["side"] == "P1"]
-        p2_ships = [s for s in game_state["ships"].values() if s["side"] == "P2"]
-
-        p1_ship = p1_ships[0]
-        p2_ship = p2_ships[0]
+        p1_ids, p2_ids = ship_ids_by_side(game_state["scenario_id"]).values()
+        p1_ship_id, p2_ship_id = p1_ids[0], p2_ids[0]
 
         # Check both broadsides - at least one should have no targets
         # (After simple movement "2", ships may not be in each other's arc)
         left_response = client.post(
             f"/games/{game_id}/turns/1/combat/fire",
             json={
-                "ship_id": p1_ship["id"],
+                "ship_id": p1_ship_id,
                 "broadside": "L",
-                "target_ship_id": p2_ship["id"],
+                "target_ship_id": p2_ship_id,
                 "aim": "hull",
             },
         )
@@ -795,9 +743,9 @@ class TestFireBroadsideErrorHandling:
         right_response = client.post(
             f"/games/{game_id}/turns/1/combat/fire",
             json={
-                "ship_id": p1_ship["id"],
+                "ship_id": p1_ship_id,
                 "broadside": "R",
-                "target_ship_id": p2_ship["id"],
+                "target_ship_id": p2_ship_id,
                 "aim": "hull",
             },
         )
@@ -815,102 +763,82 @@ class TestFireBroadsideErrorHandling:
         # The key is we're testing the 400 error paths
         assert "target" in detail or "fire" in detail
 
-    def test_fire_broadside_struck_ship_cannot_fire(self) -> None:
+    def test_fire_broadside_struck_ship_cannot_fire(
+        self, client: TestClient, combat_game: tuple[str, dict], duel_ship_ids: tuple[str, str]
+    ) -> None:
         """Test that a struck ship cannot fire its broadsides."""
-        game_id, game_state = self.setup_combat_phase()
-
-        # Get a ship and mark it as struck
-        ships = list(game_state["ships"].values())
-        ship = ships[0]
-        target = ships[1]
+        game_id, _ = combat_game
+        ship_id, target_id = duel_ship_ids
 
-        # Access the game store directly to modify ship state
-        store = get_game_store()
-        game = store.get_game(game_id)
-        assert game is not None
-        game.ships[ship["id"]].struck = True
-        store.update_game(game)
+        # Modify ship state directly in the store
+        with mutate_game(game_id) as game:
+            game.ships[ship_id].struck = True
 
         # Try to fire with the struck ship
         response = client.post(
             f"/games/{game_id}/turns/1/combat/fire",
             json={
-                "ship_id": ship["id"],
+                "ship_id": ship_id,
                 "broadside": "L",
-                "target_ship_id": target["id"],
+                "target_ship_id": target_id,
                 "aim": "hull",
             },
         )
 
-        assert response.status_code == 400
-        detail = response.json()["detail"].lower()
+        detail = error_detail(response, 400).lower()
         assert "cannot fire" in detail
         assert "struck" in detail
 
-    def test_fire_broadside_empty_broadside_cannot_fire(self) -> None:
+    def test_fire_broadside_empty_broadside_cannot_fire(
+        self, client: TestClient, combat_game: tuple[str, dict], duel_ship_ids: tuple[str, str]
+    ) -> None:
         """Test that an empty (unloaded) broadside cannot fire."""
-        from wsim_core.models.common import LoadState
+        game_id, _ = combat_game
+        ship_id, target_id = duel_ship_ids
 
-        game_id, game_state = self.setup_combat_phase()
-
-        # Get ships
-        ships = list(game_state["ships"].values())
-        ship = ships[0]
-        target = ships[1]
-
-        # Access the game store directly to set broadside to empty
-        store = get_game_store()
-        game = store.get_game(game_id)
-        assert game is not None
-        game.ships[ship["id"]].load_L = LoadState.EMPTY
-        store.update_game(game)
+        # Set the broadside to empty directly in the store
+        with mutate_game(game_id) as game:
+            game.ships[ship_id].load_L = LoadState.EMPTY
 
         # Try to fire with the empty broadside
         response = client.post(
             f"/games/{game_id}/turns/1/combat/fire",
             json={
-                "ship_id": ship["id"],
+                "ship_id": ship_id,
                 "broadside": "L",
-                "target_ship_id": target["id"],
+                "target_ship_id": target_id,
                 "aim": "hull",
             },
         )
 
-        assert response.status_code == 400
-        detail = response.json()["detail"].lower()
+        detail = error_detail(response, 400).lower()
         assert "cannot fire" in detail
         assert "not loaded" in detail
 
-    def test_fire_broadside_no_guns_on_broadside(self) -> None:
+    def test_fire_broadside_no_guns_on_broadside(
+        self, client: TestClient, combat_game: tuple[str, dict], duel_ship_ids: tuple[str, str]
+    ) -> None:
         """Test that a broadside with no guns cannot fire."""
-        game_id, game_state = self.setup_combat_phase()
-
-        # Get ships
-        ships = list(game_state["ships"].values())
-        ship = ships[0]
-        target = ships[1]
+        game_id, _ = combat_game
+        ship_id, target_id = duel_ship_ids
 
-        # Access the game store directly to set guns to 0
-        store = get_game_store()
-        game = store.get_game(game_id)
-        assert game is not None
-        game.ships[ship["id"]].guns_L = 0
-        game.ships[ship["id"]].carronades_L = 0
-        store.update_game(game)
+        # Set guns to 0 directly in the store
+        with mutate_game(game_id) as game:
+            game.ships[ship_id].guns_L = 0
+            game.ships[ship_id].carronades_L = 0
 
         # Try to fire with the broadside that has no guns
         response = client.post(
             f"/games/{game_id}/turns/1/combat/fire",
             json={
-                "ship_id": ship["id"],
+                "ship_id": ship_id,
                 "broadside": "L",
-                "target_ship_id": target["id"],
+                "target_ship_id": target_id,
                 "aim": "hull",
             },
         )
 
-        assert response.status_code == 400
-        detail = response.json()["detail"].lower()
+        detail = error_detail(response, 400).lower()
         assert "cannot fire" in detail
         assert "no guns" in detail
 
@@ -918,128 +846,140 @@ class TestFireBroadsideErrorHandling:
 class TestScenarioListErrorHandling:
     """Tests for scenario listing error handling."""
 
-    def test_list_scenarios_invalid_scenario_skipped(self) -> None:
+    def test_list_scenarios_invalid_scenario_skipped(self, scenarios_list: list[dict]) -> None:
         """Test that invalid scenario files are skipped gracefully."""
         # This test verifies that the endpoint handles ScenarioLoadError
         # by skipping invalid files. The actual behavior is tested by
         # ensuring valid scenarios are still returned even if some are invalid.
-        response = client.get("/games/scenarios")
-        assert response.status_code == 200
-        scenarios = response.json()
+        scenarios = scenarios_list
         assert isinstance(scenarios, list)
         # Should have at least the valid test scenarios
         assert len(scenarios) > 0
 
+    def test_list_scenarios_reparses_only_changed_files(
+        self, client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the listing parses each file once and re-parses only changed files."""
+        source = games.SCENARIOS_DIR / "mvp_frigate_duel_v1.json"
+        scenario_file = tmp_path / "duel.json"
+        broken_file = tmp_path / "broken.json"
+        shutil.copy(source, scenario_file)
+        broken_file.write_text("{not json")
+        monkeypatch.setattr(games, "SCENARIOS_DIR", tmp_path)
+        monkeypatch.setattr(games, "_MANIFEST_CACHE", {})
+
+        parses: Counter[str] = Counter()
+        load_scenario = games.load_scenario_from_file
+
+        def counting_load(path: Path) -> Scenario:
+            parses[str(path)] += 1
+            return load_scenario(path)
+
+        monkeypatch.setattr(games, "load_scenario_from_file", counting_load)
+
+        response = client.get("/games/scenarios")
+        assert response.status_code == 200
+        assert [s["id"] for s in response.json()] == ["mvp_frigate_duel_v1"]
+        assert parses == {str(scenario_file): 1, str(broken_file): 1}
+
+        # Nothing changed: neither the valid nor the invalid file is parsed again
+        client.get("/games/scenarios")
+        assert parses == {str(scenario_file): 1, str(broken_file): 1}
+
+        data = json.loads(scenario_file.read_text())
+        data["name"] = "Renamed Duel"
+        scenario_file.write_text(json.dumps(data))
+        stat = scenario_file.stat()
+        os.utime(scenario_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        response = client.get("/games/scenarios")
+        assert [s["name"] for s in response.json()] == ["Renamed Duel"]
+        assert parses == {str(scenario_file): 2, str(broken_file): 1}
+
+    def test_list_scenarios_drops_deleted_files_from_cache(
+        self, client: TestClient, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that files removed from the scenarios directory leave the listing cache."""
+        shutil.copy(games.SCENARIOS_DIR / "mvp_frigate_duel_v1.json", tmp_path / "duel.json")
+        broken_file = tmp_path / "broken.json"
+        broken_file.write_text("{not json")
+        monkeypatch.setattr(games, "SCENARIOS_DIR", tmp_path)
+        monkeypatch.setattr(games, "_MANIFEST_CACHE", {})
+
+        client.get("/games/scenarios")
+        assert str(broken_file) in games._MANIFEST_CACHE
+
+        broken_file.unlink()
+        client.get("/games/scenarios")
+        assert set(games._MANIFEST_CACHE) == {str(tmp_path / "duel.json")}
+
 
 class TestVictoryConditionsDuringGameplay:
     """Tests for victory conditions triggered during combat and reload phases."""
 
-    def test_victory_triggered_during_combat_phase(self) -> None:
+    def test_victory_triggered_during_combat_phase(
+        self, client: TestClient, combat_game: tuple[str, dict], duel_ship_ids: tuple[str, str]
+    ) -> None:
         """Test that victory condition is checked and game ends during combat phase.
 
         This test covers lines 694-699 in wsim_api/routers/games.py where
         victory conditions are checked after combat resolution.
         """
-        # Create a frigate duel game with "first_struck" victory condition
-        game_data = create_test_game()
-        game_id = game_data["game_id"]
-        game_state = game_data["state"]
+        # Frigate duel game in combat phase, with "first_struck" victory condition
+        game_id, game_state = combat_game
+        assert game_state["phase"] == "combat"
+        assert game_state["game_ended"] is False
+        ship_id, target_id = duel_ship_ids
 
-        # Submit orders and mark ready for both players
-        p1_orders = get_ship_orders(game_state, "P1")
-        p2_orders = get_ship_orders(game_state, "P2")
+        # Bring the target under the L broadside with no hull left, so any hit strikes it
+        with mutate_game(game_id) as game:
+            place_abeam(game, ship_id, target_id)
+            game.ships[target_id].hull = 0
 
-        client.post(
-            f"/games/{game_id}/turns/1/orders",
-            json={"side": "P1", "orders": p1_orders},
-        )
-        client.post(
-            f"/games/{game_id}/turns/1/orders",
-            json={"side": "P2", "orders": p2_orders},
+        response = client.post(
+            f"/games/{game_id}/turns/1/combat/fire",
+            json={"ship_id": ship_id, "broadside": "L", "target_ship_id": target_id, "aim": "hull"},
         )
-        client.post(f"/games/{game_id}/turns/1/ready", json={"side": "P1"})
-        client.post(f"/games/{game_id}/turns/1/ready", json={"side": "P2"})
 
-        # Resolve movement to combat phase
-        response = client.post(f"/games/{game_id}/turns/1/resolve/movement")
         assert response.status_code == 200
         game_state = response.json()["state"]
+        assert game_state["ships"][target_id]["struck"] is True
+        assert game_state["game_ended"] is True
+        assert game_state["winner"] == "P1"
         assert game_state["phase"] == "combat"
-        assert game_state["game_ended"] is False
 
-        # Get ships for combat
-        p1_ships = [s for s in game_state["ships"].values() if s["side"] == "P1"]
-        p2_ships = [s for s in game_state["ships"].values() if s["side"] == "P2"]
-
-        # Fire broadsides repeatedly to cause a ship to strike
-        # We'll keep firing until we cause enough damage
-        # Increase attempts and fire from both sides to increase probability
-        max_attempts = 200  # Increased attempts
-        game_ended = False
-
-        for _attempt in range(max_attempts):
-            if game_ended:
-                break
-
-            # Alternate between P1 and P2 ships firing
-            for firing_ships, target_ships in [(p1_ships, p2_ships), (p2_ships, p1_ships)]:
-                if game_ended:
-                    break
-
-                # Refresh game state to get current ship status
-                current_state = client.get(f"/games/{game_id}").json()
-                if current_state["game_ended"]:
-                    game_ended = True
-                    game_state = current_state
-                    # Verify victory was handled correctly
-                    assert game_state["winner"] is not None
-                    assert game_state["phase"] == "combat"
-                    events = game_state["event_log"]
-                    victory_events = [e for e in events if e["event_type"] == "game_end"]
-                    assert len(victory_events) >= 1
-                    victory_event = victory_events[-1]
-                    assert victory_event["metadata"]["winner"] == game_state["winner"]
-                    assert "struck" in victory_event["summary"].lower()
-                    break
-
-                # Try firing from first ship
-                for broadside in ["L", "R"]:
-                    response = client.post(
-                        f"/games/{game_id}/turns/1/combat/fire",
-                        json={
-                            "ship_id": firing_ships[0]["id"],
-                            "broadside": broadside,
-                            "target_ship_id": target_ships[0]["id"],
-                            "aim": "hull",
-                        },
-                    )
-
-                    if response.status_code == 200:
-                        result = response.json()
-                        game_state = result["state"]
-
-                        # Check if victory was triggered
-                        if game_state["game_ended"]:
-                            game_ended = True
-                            assert game_state["winner"] is not None
-                            assert game_state["phase"] == "combat"
-
-                            # Verify victory event was added to event log
-                            events = game_state["event_log"]
-                            victory_events = [e for e in events if e["event_type"] == "game_end"]
-                            assert len(victory_events) >= 1
-                            victory_event = victory_events[-1]
-                            assert victory_event["metadata"]["winner"] == game_state["winner"]
-                            assert "struck" in victory_event["summary"].lower()
-                            break
-
-        # Note: Due to the probabilistic nature of combat, we may or may not trigger
-        # a victory condition in the limited attempts. The key is that the victory check
-        # code path at lines 694-699 gets exercised during combat.
-        # If victory was triggered, we've verified it was handled correctly above.
-        # The full victory condition testing is covered in E2E tests.
-
-    def test_victory_by_turn_limit_during_reload_phase(self) -> None:
+        # Verify victory event was added to event log
+        victory_events = [e for e in game_state["event_log"] if e["event_type"] == "game_end"]
+        assert len(victory_events) == 1
+        assert victory_events[0]["metadata"]["winner"] == "P1"
+        assert "struck" in victory_events[0]["summary"].lower()
+
+    def test_victory_event_returned_without_log(
+        self, client: TestClient, combat_game: tuple[str, dict], duel_ship_ids: tuple[str, str]
+    ) -> None:
+        """Test that a game-ending shot returns the game_end event when the log is omitted."""
+        game_id, _ = combat_game
+        ship_id, target_id = duel_ship_ids
+
+        with mutate_game(game_id) as game:
+            place_abeam(game, ship_id, target_id)
+            game.ships[target_id].hull = 0
+
+        response = client.post(
+            f"/games/{game_id}/turns/1/combat/fire",
+            params={"include_log": "false"},
+            json={"ship_id": ship_id, "broadside": "L", "target_ship_id": target_id, "aim": "hull"},
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["state"]["game_ended"] is True
+        assert data["state"]["event_log"] == []
+        assert [e["event_type"] for e in data["events"]] == ["broadside_fire", "game_end"]
+
+    def test_victory_by_turn_limit_during_reload_phase(
+        self, client: TestClient, combat_game: tuple[str, dict]
+    ) -> None:
         """Test that victory condition is checked at turn limit during reload phase.
 
         This test covers lines 870-876 in wsim_api/routers/games.py where
@@ -1048,33 +988,13 @@ class TestVictoryConditionsDuringGameplay:
         Note: This test verifies the code path is exercised. The actual turn limit victory
         is tested more thoroughly in E2E tests.
         """
-        # Create a game with turn limit (frigate duel has turn_limit=20)
-        game_data = create_test_game()
-        game_id = game_data["game_id"]
-        game_state = game_data["state"]
+        # Game with turn limit (frigate duel has turn_limit=20), movement resolved
+        game_id, game_state = combat_game
 
         turn_limit = game_state["turn_limit"]
         assert turn_limit is not None
         assert turn_limit == 20
 
-        # Submit orders for turn 1
-        p1_orders = get_ship_orders(game_state, "P1")
-        p2_orders = get_ship_orders(game_state, "P2")
-
-        client.post(
-            f"/games/{game_id}/turns/1/orders",
-            json={"side": "P1", "orders": p1_orders},
-        )
-        client.post(
-            f"/games/{game_id}/turns/1/orders",
-            json={"side": "P2", "orders": p2_orders},
-        )
-        client.post(f"/games/{game_id}/turns/1/ready", json={"side": "P1"})
-        client.post(f"/games/{game_id}/turns/1/ready", json={"side": "P2"})
-
-        # Resolve movement
-        client.post(f"/games/{game_id}/turns/1/resolve/movement")
-
         # Resolve reload - this exercises the victory check code at lines 870-876
         response = client.post(f"/games/{game_id}/turns/1/resolve/reload")
         assert response.status_code == 200
@@ -1088,19 +1008,14 @@ class TestVictoryConditionsDuringGameplay:
         # But the victory check code has been executed (providing code coverage)
         # The actual turn limit victory logic is tested in E2E tests
 
-    def test_victory_by_two_ships_struck_during_combat(self) -> None:
+    def test_victory_by_two_ships_struck_during_combat(self, client: TestClient) -> None:
         """Test victory when one side loses two ships during combat.
 
         This tests the "first_side_struck_two_ships" victory condition
         being triggered during combat phase.
         """
         # Create two-ship line battle game with "first_side_struck_two_ships"
-        response = client.post(
-            "/games",
-            json={"scenario_id": "mvp_two_ship_line_battle_v1"},
-        )
-        assert response.status_code == 201
-        game_data = response.json()
+        game_data = create_test_game("mvp_two_ship_line_battle_v1")
         game_id = game_data["game_id"]
         game_state = game_data["state"]
 
@@ -1108,128 +1023,54 @@ class TestVictoryConditionsDuringGameplay:
         assert game_state["victory_condition"] == "first_side_struck_two_ships"
 
         # Count ships per side
-        p1_ships = [s for s in game_state["ships"].values() if s["side"] == "P1"]
-        p2_ships = [s for s in game_state["ships"].values() if s["side"] == "P2"]
-        assert len(p1_ships) >= 2
-        assert len(p2_ships) >= 2
-
-        # Submit orders and get to combat phase
-        p1_orders = get_ship_orders(game_state, "P1")
-        p2_orders = get_ship_orders(game_state, "P2")
+        p1_ids, p2_ids = ship_ids_by_side(game_state["scenario_id"]).values()
+        assert len(p1_ids) >= 2
+        assert len(p2_ids) >= 2
+        ship_id, (target_id, already_struck_id) = p1_ids[0], p2_ids[:2]
+
+        # P2 has already lost one ship; the next to strike is in P1's L arc with no hull left
+        with mutate_game(game_id) as game:
+            game.phase = GamePhase.COMBAT
+            game.ships[already_struck_id].struck = True
+            place_abeam(game, ship_id, target_id)
+            game.ships[target_id].hull = 0
 
-        client.post(
-            f"/games/{game_id}/turns/1/orders",
-            json={"side": "P1", "orders": p1_orders},
-        )
-        client.post(
-            f"/games/{game_id}/turns/1/orders",
-            json={"side": "P2", "orders": p2_orders},
+        response = client.post(
+            f"/games/{game_id}/turns/1/combat/fire",
+            json={"ship_id": ship_id, "broadside": "L", "target_ship_id": target_id, "aim": "hull"},
         )
-        client.post(f"/games/{game_id}/turns/1/ready", json={"side": "P1"})
-        client.post(f"/games/{game_id}/turns/1/ready", json={"side": "P2"})
-        client.post(f"/games/{game_id}/turns/1/resolve/movement")
 
-        # Fire broadsides to try to strike two ships
-        # This is probabilistic, so we'll try many times
-        max_attempts = 100
-        game_ended = False
-
-        for _ in range(max_attempts):
-            if game_ended:
-                break
-
-            current_state = client.get(f"/games/{game_id}").json()
-            if current_state["game_ended"]:
-                game_ended = True
-                break
-
-            # Try firing from various ships
-            p1_ships_current = [s for s in current_state["ships"].values() if s["side"] == "P1"]
-            p2_ships_current = [s for s in current_state["ships"].values() if s["side"] == "P2"]
-
-            # Fire from P1 ships at P2 ships
-            for p1_ship in p1_ships_current:
-                if game_ended:
-                    break
-                for broadside in ["L", "R"]:
-                    if game_ended:
-                        break
-                    for p2_ship in p2_ships_current:
-                        response = client.post(
-                            f"/games/{game_id}/turns/1/combat/fire",
-                            json={
-                                "ship_id": p1_ship["id"],
-                                "broadside": broadside,
-                                "target_ship_id": p2_ship["id"],
-                                "aim": "hull",
-                            },
-                        )
-
-                        if response.status_code == 200:
-                            result = response.json()
-                            if result["state"]["game_ended"]:
-                                game_ended = True
-                                game_state = result["state"]
-
-                                # Verify victory condition
-                                assert game_state["winner"] is not None
-                                assert game_state["phase"] == "combat"
-
-                                # Check victory event
-                                victory_events = [
-                                    e
-                                    for e in game_state["event_log"]
-                                    if e["event_type"] == "game_end"
-                                ]
-                                assert len(victory_events) >= 1
-                                victory_event = victory_events[-1]
-                                assert "two ships" in victory_event["summary"].lower()
-                                break
-
-        # Note: This test may not always trigger the condition due to randomness,
-        # but it exercises the code path when it does
-        if game_ended:
-            print("Successfully triggered two-ships victory condition")
-
-    def test_no_victory_when_conditions_not_met(self) -> None:
+        assert response.status_code == 200
+        game_state = response.json()["state"]
+        assert game_state["game_ended"] is True
+        assert game_state["winner"] == "P1"
+        assert game_state["phase"] == "combat"
+
+        # Check victory event
+        victory_events = [e for e in game_state["event_log"] if e["event_type"] == "game_end"]
+        assert len(victory_events) == 1
+        assert "two ships" in victory_events[0]["summary"].lower()
+
+    def test_no_victory_when_conditions_not_met(
+        self, client: TestClient, combat_game: tuple[str, dict]
+    ) -> None:
         """Test that game continues when victory conditions are not met.
 
         Verifies that the victory check code runs but doesn't end the game
         when conditions aren't satisfied.
         """
-        game_data = create_test_game()
-        game_id = game_data["game_id"]
-        game_state = game_data["state"]
-
-        # Get to combat phase
-        p1_orders = get_ship_orders(game_state, "P1")
-        p2_orders = get_ship_orders(game_state, "P2")
-
-        client.post(
-            f"/games/{game_id}/turns/1/orders",
-            json={"side": "P1", "orders": p1_orders},
-        )
-        client.post(
-            f"/games/{game_id}/turns/1/orders",
-            json={"side": "P2", "orders": p2_orders},
-        )
-        client.post(f"/games/{game_id}/turns/1/ready", json={"side": "P1"})
-        client.post(f"/games/{game_id}/turns/1/ready", json={"side": "P2"})
-
-        response = client.post(f"/games/{game_id}/turns/1/resolve/movement")
-        game_state = response.json()["state"]
+        game_id, game_state = combat_game
 
         # Fire one broadside (not enough to trigger victory)
-        p1_ships = [s for s in game_state["ships"].values() if s["side"] == "P1"]
-        p2_ships = [s for s in game_state["ships"].values() if s["side"] == "P2"]
+        p1_ids, p2_ids = ship_ids_by_side(game_state["scenario_id"]).values()
 
         # Try to fire (may or may not hit)
         response = client.post(
             f"/games/{game_id}/turns/1/combat/fire",
             json={
-                "ship_id": p1_ships[0]["id"],
+                "ship_id": p1_ids[0],
                 "broadside": "L",
-                "target_ship_id": p2_ships[0]["id"],
+                "target_ship_id": p2_ids[0],
                 "aim": "rigging",  # Aim at rigging, less likely to cause striking
             },
         )
@@ -1254,195 +1095,114 @@ class TestVictoryConditionsDuringGameplay:
 class TestErrorHandling:
     """Tests for error handling paths in the games router."""
 
-    def test_get_broadside_arc_invalid_broadside(self):
+    def test_get_broadside_arc_invalid_broadside(self, client: TestClient, unplayed_game_id: str):
         """Test get_broadside_arc with invalid broadside parameter."""
-        game_data = create_test_game()
-        game_id = game_data["game_id"]
-        game_state = game_data["state"]
-
         # Get any ship ID
-        ship_id = list(game_state["ships"].keys())[0]
+        ship_id = ship_ids_by_side("mvp_frigate_duel_v1")["P1"][0]
 
         # Try with invalid broadside value (not 'L' or 'R')
-        response = client.get(f"/games/{game_id}/ships/{ship_id}/broadside/X/arc")
-        assert response.status_code == 400
-        assert "broadside must be" in response.json()["detail"].lower()
+        response = client.get(f"/games/{unplayed_game_id}/ships/{ship_id}/broadside/X/arc")
+        assert "broadside must be" in error_detail(response, 400).lower()
 
-    def test_create_game_with_invalid_scenario(self):
+    def test_create_game_with_invalid_scenario(self, client: TestClient):
         """Test create_game with a non-existent scenario ID."""
         response = client.post(
             "/games",
             json={"scenario_id": "nonexistent_scenario_xyz"},
         )
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
+        assert "not found" in error_detail(response, 404).lower()
 
-    def test_fire_broadside_invalid_broadside_parameter(self):
-        """Test fire_broadside with invalid broadside parameter."""
-        game_data = create_test_game()
-        game_id = game_data["game_id"]
-        game_state = game_data["state"]
-
-        # Get to combat phase
-        p1_orders = get_ship_orders(game_state, "P1")
-        p2_orders = get_ship_orders(game_state, "P2")
-
-        client.post(
-            f"/games/{game_id}/turns/1/orders",
-            json={"side": "P1", "orders": p1_orders},
-        )
-        client.post(
-            f"/games/{game_id}/turns/1/orders",
-            json={"side": "P2", "orders": p2_orders},
-        )
-        client.post(f"/games/{game_id}/turns/1/ready", json={"side": "P1"})
-        client.post(f"/games/{game_id}/turns/1/ready", json={"side": "P2"})
-        response = client.post(f"/games/{game_id}/turns/1/resolve/movement")
-        game_state = response.json()["state"]
+    def test_fire_broadside_invalid_broadside_parameter(
+        self, client: TestClient, duel_ship_ids: tuple[str, str]
+    ):
+        """Test fire_broadside with invalid broadside parameter.
 
-        # Get ship IDs
-        p1_ships = [s for s in game_state["ships"].values() if s["side"] == "P1"]
-        p2_ships = [s for s in game_state["ships"].values() if s["side"] == "P2"]
+        Request validation runs before the game lookup, so no game is needed.
+        """
+        ship_id, target_id = duel_ship_ids
 
         # Try to fire with invalid broadside
         response = client.post(
-            f"/games/{game_id}/turns/1/combat/fire",
+            "/games/nonexistent/turns/1/combat/fire",
             json={
-                "ship_id": p1_ships[0]["id"],
+                "ship_id": ship_id,
                 "broadside": "INVALID",  # Invalid broadside
-                "target_ship_id": p2_ships[0]["id"],
+                "target_ship_id": target_id,
                 "aim": "hull",
             },
         )
         assert response.status_code == 422  # Validation error
 
-    def test_fire_broadside_invalid_aim_parameter(self):
-        """Test fire_broadside with invalid aim parameter."""
-        game_data = create_test_game()
-        game_id = game_data["game_id"]
-        game_state = game_data["state"]
-
-        # Get to combat phase
-        p1_orders = get_ship_orders(game_state, "P1")
-        p2_orders = get_ship_orders(game_state, "P2")
+    def test_fire_broadside_invalid_aim_parameter(
+        self, client: TestClient, duel_ship_ids: tuple[str, str]
+    ):
+        """Test fire_broadside with invalid aim parameter.
 
-        client.post(
-            f"/games/{game_id}/turns/1/orders",
-            json={"side": "P1", "orders": p1_orders},
-        )
-        client.post(
-            f"/games/{game_id}/turns/1/orders",
-            json={"side": "P2", "orders": p2_orders},
-        )
-        client.post(f"/games/{game_id}/turns/1/ready", json={"side": "P1"})
-        client.post(f"/games/{game_id}/turns/1/ready", json={"side": "P2"})
-        response = client.post(f"/games/{game_id}/turns/1/resolve/movement")
-        game_state = response.json()["state"]
-
-        # Get ship IDs
-        p1_ships = [s for s in game_state["ships"].values() if s["side"] == "P1"]
-        p2_ships = [s for s in game_state["ships"].values() if s["side"] == "P2"]
+        Request validation runs before the game lookup, so no game is needed.
+        """
+        ship_id, target_id = duel_ship_ids
 
         # Try to fire with invalid aim
         response = client.post(
-            f"/games/{game_id}/turns/1/combat/fire",
+            "/games/nonexistent/turns/1/combat/fire",
             json={
-                "ship_id": p1_ships[0]["id"],
+                "ship_id": ship_id,
                 "broadside": "L",
-                "target_ship_id": p2_ships[0]["id"],
+                "target_ship_id": target_id,
                 "aim": "invalid_aim",  # Invalid aim
             },
         )
         assert response.status_code == 422  # Validation error
 
 
-class TestAdditionalErrorPaths:
-    """Tests for additional error paths to improve coverage."""
+class TestAdvanceAndFireErrorPaths:
+    """Tests for advance and fire error paths."""
 
-    def test_advance_turn_when_game_ended(self) -> None:
+    def test_advance_turn_when_game_ended(self, client: TestClient) -> None:
         """Test that advancing turn fails when game has already ended (line 936)."""
         # Create a game
         game_data = create_test_game()
         game_id = game_data["game_id"]
 
         # Manually set the game to ended state via the store
-        store = get_game_store()
-        game = store.get_game(game_id)
-        assert game is not None
-        game.game_ended = True
-        game.winner = "P1"
-        game.phase = GamePhase.RELOAD  # Must be in RELOAD phase to try advancing
-        store.update_game(game)
+        with mutate_game(game_id) as game:
+            game.game_ended = True
+            game.winner = "P1"
+            game.phase = GamePhase.RELOAD  # Must be in RELOAD phase to try advancing
 
         # Try to advance turn
         response = client.post(f"/games/{game_id}/turns/1/advance")
-        assert response.status_code == 400
-        assert "game has ended" in response.json()["detail"].lower()
-        assert "P1" in response.json()["detail"]
-
-    def test_fire_broadside_illegal_target_not_closest(self) -> None:
-        """Test firing at a target that's not a legal closest target (lines 604-605)."""
-        # This test needs a specific scenario with multiple enemy ships
-        # where one is closer than the other
-        game_data = create_test_game()
-        game_id = game_data["game_id"]
-        game_state = game_data["state"]
-
-        # Get to combat phase
-        p1_orders = get_ship_orders(game_state, "P1")
-        p2_orders = get_ship_orders(game_state, "P2")
-
-        client.post(
-            f"/games/{game_id}/turns/1/orders",
-            json={"side": "P1", "orders": p1_orders},
-        )
-        client.post(
-            f"/games/{game_id}/turns/1/orders",
-            json={"side": "P2", "orders": p2_orders},
-        )
-        client.post(f"/games/{game_id}/turns/1/ready", json={"side": "P1"})
-        client.post(f"/games/{game_id}/turns/1/ready", json={"side": "P2"})
-        response = client.post(f"/games/{game_id}/turns/1/resolve/movement")
-        game_state = response.json()["state"]
+        detail = error_detail(response, 400)
+        assert "game has ended" in detail.lower()
+        assert "P1" in detail
+
+    def test_fire_broadside_illegal_target_not_closest(self, client: TestClient) -> None:
+        """Test that firing past the closest enemy in arc is rejected."""
+        game_id = store_scenario_game("mvp_two_ship_line_battle_v1").id
+        ship_id, near_id, far_id = "p1_frigate_1", "p2_frigate_1", "p2_brig_1"
+
+        # Both P2 ships lie under the frigate's L broadside, the brig three hexes further off
+        with mutate_game(game_id) as game:
+            game.phase = GamePhase.COMBAT
+            place_abeam(game, ship_id, near_id)
+            far = game.ships[far_id]
+            far.bow_hex = HexCoord(col=10, row=4)
+            far.stern_hex = HexCoord(col=11, row=4)
+            far.facing = Facing.W
+
+        arc = client.get(f"/games/{game_id}/ships/{ship_id}/broadside/L/arc").json()
+        assert {near_id, far_id} <= set(arc["ships_in_arc"])
+        assert arc["valid_targets"] == [near_id]
 
-        # Get ship IDs
-        p1_ships = [s for s in game_state["ships"].values() if s["side"] == "P1"]
-        p2_ships = [s for s in game_state["ships"].values() if s["side"] == "P2"]
-
-        if len(p2_ships) < 2:
-            # Skip if we don't have multiple targets
-            pytest.skip("Scenario doesn't have multiple P2 ships")
-
-        firing_ship = p1_ships[0]
-
-        # Get the legal targets for this ship
-        arc_response = client.get(f"/games/{game_id}/ships/{firing_ship['id']}/broadside/L/arc")
-        assert arc_response.status_code == 200
-        legal_targets = arc_response.json()["valid_targets"]
-
-        # If there are legal targets, find a P2 ship that's NOT in legal targets
-        p2_ship_ids = {s["id"] for s in p2_ships}
-        illegal_targets = p2_ship_ids - set(legal_targets)
-
-        if not illegal_targets:
-            # All P2 ships are legal targets, we can't test this path
-            pytest.skip("All enemy ships are legal targets")
-
-        # Try to fire at an illegal target
-        illegal_target_id = next(iter(illegal_targets))
         response = client.post(
             f"/games/{game_id}/turns/1/combat/fire",
-            json={
-                "ship_id": firing_ship["id"],
-                "broadside": "L",
-                "target_ship_id": illegal_target_id,
-                "aim": "hull",
-            },
+            json={"ship_id": ship_id, "broadside": "L", "target_ship_id": far_id, "aim": "hull"},
         )
-        assert response.status_code == 400
-        assert "not a legal target" in response.json()["detail"].lower()
+        assert "not a legal target" in error_detail(response, 400).lower()
 
-    def test_fire_broadside_target_not_found(self) -> None:
+    def test_fire_broadside_target_not_found(
+        self, client: TestClient, combat_game: tuple[str, dict]
+    ) -> None:
         """Test firing at a target ship that doesn't exist (lines 616-617).
 
         Note: This test actually triggers line 604-605 first because the
@@ -1450,62 +1210,30 @@ class TestAdditionalErrorPaths:
         target_ship lookup. This is expected behavior - the test still provides
         value by testing an error path.
         """
-        game_data = create_test_game()
-        game_id = game_data["game_id"]
-        game_state = game_data["state"]
-
-        # Get to combat phase
-        p1_orders = get_ship_orders(game_state, "P1")
-        p2_orders = get_ship_orders(game_state, "P2")
-
-        client.post(
-            f"/games/{game_id}/turns/1/orders",
-            json={"side": "P1", "orders": p1_orders},
-        )
-        client.post(
-            f"/games/{game_id}/turns/1/orders",
-            json={"side": "P2", "orders": p2_orders},
-        )
-        client.post(f"/games/{game_id}/turns/1/ready", json={"side": "P1"})
-        client.post(f"/games/{game_id}/turns/1/ready", json={"side": "P2"})
-        response = client.post(f"/games/{game_id}/turns/1/resolve/movement")
-        game_state = response.json()["state"]
+        game_id, game_state = combat_game
 
         # Get a P1 ship
-        p1_ships = [s for s in game_state["ships"].values() if s["side"] == "P1"]
-        firing_ship = p1_ships[0]
+        p1_ids = ship_ids_by_side(game_state["scenario_id"])["P1"]
+        firing_ship_id = p1_ids[0]
 
         # Try to fire at a non-existent target
         response = client.post(
             f"/games/{game_id}/turns/1/combat/fire",
             json={
-                "ship_id": firing_ship["id"],
+                "ship_id": firing_ship_id,
                 "broadside": "L",
                 "target_ship_id": "nonexistent_target_ship",
                 "aim": "hull",
             },
         )
         # Expecting 400 because it fails legal target check (no targets in arc)
-        assert response.status_code == 400
-        assert "no legal targets" in response.json()["detail"].lower()
+        assert "no legal targets" in error_detail(response, 400).lower()
 
 
 class TestAdditionalErrorPaths:
     """Tests for additional error paths to improve coverage."""
 
-    def test_get_game_not_found(self) -> None:
-        """Test getting a game that doesn't exist (line 161)."""
-        response = client.get("/games/nonexistent_game_id")
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
-
-    def test_delete_game_not_found(self) -> None:
-        """Test deleting a game that doesn't exist (lines 176-181)."""
-        response = client.delete("/games/nonexistent_game_id")
-        assert response.status_code == 404
-        assert "not found" in response.json()["detail"].lower()
-
-    def test_delete_game_success(self) -> None:
+    def test_delete_game_success(self, client: TestClient) -> None:
         """Test successfully deleting a game."""
         game_data = create_test_game()
         game_id = game_data["game_id"]
@@ -202,8 +202,7 @@ def test_list_saved_games(temp_save_dir, sample_game):
     # Save multiple games
     persistence.save_game(sample_game)
 
-    game2 = sample_game.model_copy(deep=True)
-    game2.id = "test-game-456"
+    game2 = sample_game.fork("test-game-456")
     persistence.save_game(game2)
 
     game_ids = persistence.list_saved_games()
@@ -229,11 +228,9 @@ def test_save_all_games(temp_save_dir, sample_game):
     """Test saving multiple games at once."""
     persistence = GamePersistence(temp_save_dir)
 
-    game2 = sample_game.model_copy(deep=True)
-    game2.id = "test-game-456"
+    game2 = sample_game.fork("test-game-456")
 
-    game3 = sample_game.model_copy(deep=True)
-    game3.id = "test-game-789"
+    game3 = sample_game.fork("test-game-789")
 
     saved_paths = persistence.save_all_games([sample_game, game2, game3])
 
@@ -246,8 +243,7 @@ def test_load_all_games(temp_save_dir, sample_game):
     persistence = GamePersistence(temp_save_dir)
 
     # Save multiple games
-    game2 = sample_game.model_copy(deep=True)
-    game2.id = "test-game-456"
+    game2 = sample_game.fork("test-game-456")
 
     persistence.save_game(sample_game)
     persistence.save_game(game2)
@@ -266,8 +262,7 @@ def test_clear_all_saved_games(temp_save_dir, sample_game):
     persistence = GamePersistence(temp_save_dir)
 
     # Save multiple games
-    game2 = sample_game.model_copy(deep=True)
-    game2.id = "test-game-456"
+    game2 = sample_game.fork("test-game-456")
 
     persistence.save_game(sample_game)
     persistence.save_game(game2)
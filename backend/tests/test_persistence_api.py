@@ -4,17 +4,13 @@ import tempfile
 from pathlib import Path
 
 import pytest
-from fastapi.testclient import TestClient
 
-from wsim_api.main import app
 from wsim_api.persistent_store import PersistentGameStore
 from wsim_core.models.common import Facing, GamePhase, LoadState, WindDirection
 from wsim_core.models.game import Game
 from wsim_core.models.hex import HexCoord
 from wsim_core.models.ship import Ship
 
-client = TestClient(app)
-
 
 @pytest.fixture
 def temp_save_dir():
@@ -99,7 +95,7 @@ def non_persistent_store():
     wsim_api.store._game_store = original_store
 
 
-def test_save_game_success(persistent_store, sample_game):
+def test_save_game_success(client, persistent_store, sample_game):
     """Test save_game endpoint with valid game."""
     # Create game in store
     persistent_store.create_game(sample_game)
@@ -117,7 +113,7 @@ def test_save_game_success(persistent_store, sample_game):
     assert persistent_store._persistence.game_exists(sample_game.id)
 
 
-def test_save_game_not_found(persistent_store):
+def test_save_game_not_found(client, persistent_store):
     """Test save_game with non-existent game (404 error)."""
     response = client.post("/persistence/games/nonexistent-game/save")
 
@@ -125,7 +121,7 @@ def test_save_game_not_found(persistent_store):
     assert "not found" in response.json()["detail"].lower()
 
 
-def test_save_game_persistence_not_enabled(non_persistent_store, sample_game):
+def test_save_game_persistence_not_enabled(client, non_persistent_store, sample_game):
     """Test save_game when persistence not enabled (503 error)."""
     # Create game in non-persistent store
     non_persistent_store.create_game(sample_game)
@@ -136,7 +132,7 @@ def test_save_game_persistence_not_enabled(non_persistent_store, sample_game):
     assert "persistence not enabled" in response.json()["detail"].lower()
 
 
-def test_load_game_success(persistent_store, sample_game):
+def test_load_game_success(client, persistent_store, sample_game):
     """Test load_game endpoint with valid saved game."""
     # Save game to disk
     persistent_store._persistence.save_game(sample_game)
@@ -155,7 +151,7 @@ def test_load_game_success(persistent_store, sample_game):
     assert loaded_game.id == sample_game.id
 
 
-def test_load_game_not_found(persistent_store):
+def test_load_game_not_found(client, persistent_store):
     """Test load_game with non-existent file (404 error)."""
     response = client.post("/persistence/games/nonexistent-game/load")
 
@@ -163,7 +159,7 @@ def test_load_game_not_found(persistent_store):
     assert "not found" in response.json()["detail"].lower()
 
 
-def test_load_game_invalid_file(persistent_store, temp_save_dir):
+def test_load_game_invalid_file(client, persistent_store, temp_save_dir):
     """Test load_game with invalid game file (400 error)."""
     # Create an invalid JSON file
     invalid_file = temp_save_dir / "invalid-game.json"
@@ -175,7 +171,7 @@ def test_load_game_invalid_file(persistent_store, temp_save_dir):
     assert "invalid game file" in response.json()["detail"].lower()
 
 
-def test_load_game_persistence_not_enabled(non_persistent_store):
+def test_load_game_persistence_not_enabled(client, non_persistent_store):
     """Test load_game when persistence not enabled (503 error)."""
     response = client.post("/persistence/games/some-game/load")
 
@@ -183,13 +179,12 @@ def test_load_game_persistence_not_enabled(non_persistent_store):
     assert "persistence not enabled" in response.json()["detail"].lower()
 
 
-def test_save_all_games_success(persistent_store, sample_game):
+def test_save_all_games_success(client, persistent_store, sample_game):
     """Test save_all_games endpoint."""
     # Create multiple games
     persistent_store.create_game(sample_game)
 
-    game2 = sample_game.model_copy(deep=True)
-    game2.id = "test-game-2"
+    game2 = sample_game.fork("test-game-2")
     persistent_store.create_game(game2)
 
     # Save all via API
@@ -207,7 +202,7 @@ def test_save_all_games_success(persistent_store, sample_game):
     assert persistent_store._persistence.game_exists(game2.id)
 
 
-def test_save_all_games_empty(persistent_store):
+def test_save_all_games_empty(client, persistent_store):
     """Test save_all_games when no games exist."""
     response = client.post("/persistence/save-all")
 
@@ -217,7 +212,7 @@ def test_save_all_games_empty(persistent_store):
     assert data["game_ids"] == []
 
 
-def test_save_all_games_persistence_not_enabled(non_persistent_store):
+def test_save_all_games_persistence_not_enabled(client, non_persistent_store):
     """Test save_all_games when persistence not enabled (503 error)."""
     response = client.post("/persistence/save-all")
 
@@ -225,13 +220,12 @@ def test_save_all_games_persistence_not_enabled(non_persistent_store):
     assert "persistence not enabled" in response.json()["detail"].lower()
 
 
-def test_list_saved_games_success(persistent_store, sample_game):
+def test_list_saved_games_success(client, persistent_store, sample_game):
     """Test list_saved_games endpoint."""
     # Save multiple games
     persistent_store._persistence.save_game(sample_game)
 
-    game2 = sample_game.model_copy(deep=True)
-    game2.id = "test-game-2"
+    game2 = sample_game.fork("test-game-2")
     persistent_store._persistence.save_game(game2)
 
     # List via API
@@ -245,7 +239,7 @@ def test_list_saved_games_success(persistent_store, sample_game):
     assert game2.id in data["game_ids"]
 
 
-def test_list_saved_games_empty(persistent_store):
+def test_list_saved_games_empty(client, persistent_store):
     """Test list_saved_games when no saved games exist."""
     response = client.get("/persistence/saved-games")
 
@@ -255,7 +249,7 @@ def test_list_saved_games_empty(persistent_store):
     assert data["game_ids"] == []
 
 
-def test_list_saved_games_persistence_not_enabled(non_persistent_store):
+def test_list_saved_games_persistence_not_enabled(client, non_persistent_store):
     """Test list_saved_games when persistence not enabled (503 error)."""
     response = client.get("/persistence/saved-games")
 
@@ -263,13 +257,12 @@ def test_list_saved_games_persistence_not_enabled(non_persistent_store):
     assert "persistence not enabled" in response.json()["detail"].lower()
 
 
-def test_clear_saved_games_success(persistent_store, sample_game):
+def test_clear_saved_games_success(client, persistent_store, sample_game):
     """Test clear_saved_games endpoint."""
     # Save multiple games
     persistent_store._persistence.save_game(sample_game)
 
-    game2 = sample_game.model_copy(deep=True)
-    game2.id = "test-game-2"
+    game2 = sample_game.fork("test-game-2")
     persistent_store._persistence.save_game(game2)
 
     # Clear via API
@@ -284,7 +277,7 @@ def test_clear_saved_games_success(persistent_store, sample_game):
     assert not persistent_store._persistence.game_exists(game2.id)
 
 
-def test_clear_saved_games_empty(persistent_store):
+def test_clear_saved_games_empty(client, persistent_store):
     """Test clear_saved_games when no saved games exist."""
     response = client.delete("/persistence/saved-games")
 
@@ -293,7 +286,7 @@ def test_clear_saved_games_empty(persistent_store):
     assert data["count"] == 0
 
 
-def test_clear_saved_games_persistence_not_enabled(non_persistent_store):
+def test_clear_saved_games_persistence_not_enabled(client, non_persistent_store):
     """Test clear_saved_games when persistence not enabled (503 error)."""
     response = client.delete("/persistence/saved-games")
 
@@ -301,7 +294,7 @@ def test_clear_saved_games_persistence_not_enabled(non_persistent_store):
     assert "persistence not enabled" in response.json()["detail"].lower()
 
 
-def test_delete_saved_game_success(persistent_store, sample_game):
+def test_delete_saved_game_success(client, persistent_store, sample_game):
     """Test delete_saved_game with valid file."""
     # Save game
     persistent_store._persistence.save_game(sample_game)
@@ -318,7 +311,7 @@ def test_delete_saved_game_success(persistent_store, sample_game):
     assert not persistent_store._persistence.game_exists(sample_game.id)
 
 
-def test_delete_saved_game_not_found(persistent_store):
+def test_delete_saved_game_not_found(client, persistent_store):
     """Test delete_saved_game with non-existent file (404 error)."""
     response = client.delete("/persistence/games/nonexistent-game/saved")
 
@@ -326,7 +319,7 @@ def test_delete_saved_game_not_found(persistent_store):
     assert "not found" in response.json()["detail"].lower()
 
 
-def test_delete_saved_game_persistence_not_enabled(non_persistent_store):
+def test_delete_saved_game_persistence_not_enabled(client, non_persistent_store):
     """Test delete_saved_game when persistence not enabled (503 error)."""
     response = client.delete("/persistence/games/some-game/saved")
 
@@ -334,7 +327,7 @@ def test_delete_saved_game_persistence_not_enabled(non_persistent_store):
     assert "persistence not enabled" in response.json()["detail"].lower()
 
 
-def test_save_and_load_roundtrip(persistent_store, sample_game):
+def test_save_and_load_roundtrip(client, persistent_store, sample_game):
     """Test full save and load roundtrip maintains game state."""
     # Save game directly to disk (not through store which would auto-persist)
     file_path = persistent_store._persistence.save_game(sample_game)
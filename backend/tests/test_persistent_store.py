@@ -105,6 +105,17 @@ def test_delete_game_removes_file(store, sample_game):
     assert not store._persistence.game_exists(sample_game.id)
 
 
+def test_clear_removes_games_and_files(store, sample_game):
+    """Test that clear() removes games from memory and their files from disk."""
+    store.create_game(sample_game)
+    assert store._persistence.game_exists(sample_game.id)
+
+    store.clear()
+
+    assert store.list_games() == []
+    assert not store._persistence.game_exists(sample_game.id)
+
+
 def test_auto_load_existing_games(temp_save_dir, sample_game):
     """Test that auto_load loads existing saved games."""
     # Create and save a game
@@ -189,11 +200,9 @@ def test_multiple_games_persist(temp_save_dir, sample_game):
     store = PersistentGameStore(save_directory=temp_save_dir, auto_load=False)
 
     # Create multiple games
-    game2 = sample_game.model_copy(deep=True)
-    game2.id = "game-2"
+    game2 = sample_game.fork("game-2")
 
-    game3 = sample_game.model_copy(deep=True)
-    game3.id = "game-3"
+    game3 = sample_game.fork("game-3")
 
     store.create_game(sample_game)
     store.create_game(game2)
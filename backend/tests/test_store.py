@@ -71,6 +71,21 @@ def test_update_nonexistent_game_raises_error(store, sample_game):
         store.update_game(sample_game)
 
 
+def test_clear_removes_all_games(store, sample_game):
+    """Test that clear() removes every game from the store."""
+    store.create_game(sample_game)
+    other = sample_game.fork("test-game-store-2")
+    store.create_game(other)
+
+    store.clear()
+
+    assert store.list_games() == []
+    assert store.get_game(sample_game.id) is None
+    # Store remains usable after clearing
+    store.create_game(sample_game)
+    assert store.get_game(sample_game.id) is not None
+
+
 def test_get_game_store_with_persistence(monkeypatch):
     """Test get_game_store with WSIM_ENABLE_PERSISTENCE=true."""
     # Clear singleton
@@ -84,6 +84,14 @@ class PersistentGameStore(GameStore):
         with suppress(FileNotFoundError):
             self._persistence.delete_saved_game(game_id)
 
+    def clear(self) -> None:
+        """Delete all games from memory and their saved files from disk."""
+        game_ids = [game.id for game in self.list_games()]
+        super().clear()
+        for game_id in game_ids:
+            with suppress(FileNotFoundError):
+                self._persistence.delete_saved_game(game_id)
+
     def save_all(self) -> int:
         """Explicitly save all in-memory games to disk.
 
@@ -1,5 +1,6 @@
 """Game management API endpoints."""
 
+import os
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException
@@ -22,13 +23,15 @@ from wsim_core.engine.movement_parser import (
     validate_movement_within_allowance,
 )
 from wsim_core.engine.reload import create_reload_event, reload_all_ships
-from wsim_core.engine.rng import create_rng
+from wsim_core.engine.rng import RNG, create_rng
 from wsim_core.engine.targeting import get_all_valid_targets, get_ships_in_arc
 from wsim_core.engine.victory import check_victory_condition, create_victory_event
 from wsim_core.models.common import AimPoint, Broadside, GamePhase, LoadState
 from wsim_core.models.events import EventLogEntry
 from wsim_core.models.game import Game
 from wsim_core.models.orders import ShipOrders, TurnOrders
+from wsim_core.models.scenario import Scenario
+from wsim_core.models.ship import Ship
 from wsim_core.serialization.scenario_loader import (
     ScenarioLoadError,
     initialize_game_from_scenario,
@@ -47,6 +50,10 @@ class CreateGameRequest(BaseModel):
     """Request to create a new game."""
 
     scenario_id: str = Field(description="Scenario ID to load")
+    # Bounded to a signed 64-bit integer so the seed always survives JSON encoding
+    seed: int | None = Field(
+        default=None, ge=0, lt=2**63, description="Optional seed for reproducible dice rolls"
+    )
 
 
 class CreateGameResponse(BaseModel):
@@ -64,6 +71,85 @@ class ScenarioInfo(BaseModel):
     description: str = Field(description="Scenario description")
 
 
+# Scenario listing cache: file path -> (mtime_ns, info). Invalid files are cached
+# as None so they are not re-parsed until they change on disk. list_scenarios
+# prunes paths that are no longer in the directory.
+_MANIFEST_CACHE: dict[str, tuple[int, ScenarioInfo | None]] = {}
+
+
+def _scenario_info(entry: os.DirEntry[str]) -> ScenarioInfo | None:
+    """Get listing info for a scenario file, re-parsing only when it has changed.
+
+    Args:
+        entry: Directory entry for a scenario JSON file
+
+    Returns:
+        Scenario info, or None if the file is not a valid scenario
+    """
+    mtime_ns = entry.stat().st_mtime_ns
+    cached = _MANIFEST_CACHE.get(entry.path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    info: ScenarioInfo | None
+    try:
+        scenario = load_scenario_from_file(Path(entry.path))
+        info = ScenarioInfo(
+            id=scenario.id,
+            name=scenario.name,
+            description=scenario.description,
+        )
+    except ScenarioLoadError:
+        # Skip invalid scenario files
+        info = None
+
+    _MANIFEST_CACHE[entry.path] = (mtime_ns, info)
+    return info
+
+
+# Initial game state per scenario ID, paired with the Scenario it was built from.
+# load_scenario_from_file returns the same Scenario object until the file changes,
+# so an identity check is enough to detect a stale template.
+_GAME_TEMPLATES: dict[str, tuple[Scenario, Game]] = {}
+
+
+def _game_template(scenario_id: str, scenario: Scenario) -> Game:
+    """Get the initial game state for a scenario, building it only when the scenario changes.
+
+    The returned game is shared; callers must fork it rather than mutate it.
+
+    Args:
+        scenario_id: Scenario identifier (cache key)
+        scenario: Loaded scenario
+
+    Returns:
+        Template game with the placeholder ID ``"template"``
+    """
+    cached = _GAME_TEMPLATES.get(scenario_id)
+    if cached is None or cached[0] is not scenario:
+        cached = (scenario, initialize_game_from_scenario(scenario, "template"))
+        _GAME_TEMPLATES[scenario_id] = cached
+    return cached[1]
+
+
+def _game_rng(game: Game) -> RNG:
+    """Create the RNG for one dice-rolling action in a game.
+
+    Seeded games derive the seed from the game seed and the event log length,
+    so replaying the same actions reproduces the same rolls without every
+    action rolling the same sequence.
+
+    Args:
+        game: The game the rolls are for
+
+    Returns:
+        RNG instance (unseeded if the game has no seed)
+    """
+    if game.rng_seed is None:
+        return create_rng()
+    return create_rng(game.rng_seed + len(game.event_log))
+
+
 @router.get("/scenarios", response_model=list[ScenarioInfo])
 async def list_scenarios() -> list[ScenarioInfo]:
     """List all available scenarios.
@@ -74,24 +160,24 @@ async def list_scenarios() -> list[ScenarioInfo]:
     Raises:
         HTTPException: If scenarios directory is not accessible
     """
-    if not SCENARIOS_DIR.exists():
-        raise HTTPException(status_code=500, detail="Scenarios directory not found")
+    try:
+        with os.scandir(SCENARIOS_DIR) as it:
+            entries = sorted(
+                (e for e in it if e.name.endswith(".json") and e.is_file()),
+                key=lambda e: e.name,
+            )
+    except OSError as e:
+        raise HTTPException(status_code=500, detail="Scenarios directory not found") from e
 
     scenarios: list[ScenarioInfo] = []
+    for entry in entries:
+        info = _scenario_info(entry)
+        if info is not None:
+            scenarios.append(info)
 
-    for scenario_file in SCENARIOS_DIR.glob("*.json"):
-        try:
-            scenario = load_scenario_from_file(scenario_file)
-            scenarios.append(
-                ScenarioInfo(
-                    id=scenario.id,
-                    name=scenario.name,
-                    description=scenario.description,
-                )
-            )
-        except ScenarioLoadError:
-            # Skip invalid scenario files
-            continue
+    # Forget files that were deleted or renamed since the last listing
+    for stale_path in _MANIFEST_CACHE.keys() - {entry.path for entry in entries}:
+        del _MANIFEST_CACHE[stale_path]
 
     return scenarios
 
@@ -128,9 +214,10 @@ async def create_game(request: CreateGameRequest) -> CreateGameResponse:
             detail=f"Failed to load scenario: {e}",
         ) from e
 
-    # Generate game ID and initialize game
+    # Generate game ID and fork the scenario's initial state
     game_id = store.generate_game_id()
-    game = initialize_game_from_scenario(scenario, game_id)
+    game = _game_template(request.scenario_id, scenario).fork(game_id)
+    game.rng_seed = request.seed
 
     # Store game
     try:
@@ -181,6 +268,57 @@ async def delete_game(game_id: str) -> None:
         raise HTTPException(status_code=404, detail=str(e)) from e
 
 
+def _response_state(game: Game, include_log: bool) -> Game:
+    """Get the game state to return from a turn action.
+
+    Late in a game the event log dominates response size. Clients that track
+    events from each response's ``events`` field can pass
+    ``include_log=false`` to receive the state with an empty event log;
+    GET /games/{game_id} always returns the full log.
+
+    Args:
+        game: The updated game
+        include_log: Whether to keep the full event log in the returned state
+
+    Returns:
+        The game itself, or a shallow copy with an empty event log
+    """
+    if include_log:
+        return game
+    return game.model_copy(update={"event_log": []})
+
+
+def _validate_side_orders(game: Game, side: str, orders: list[ShipOrders]) -> None:
+    """Check that a side's orders cover exactly that side's ships.
+
+    Args:
+        game: The game the orders are for
+        side: Player side (P1 or P2)
+        orders: Submitted orders for the side
+
+    Raises:
+        HTTPException: If an order is for another side's ship or a ship has no orders
+    """
+    # Validate that all orders are for ships belonging to this player
+    player_ships = {ship.id for ship in game.get_ships_by_side(side)}
+    order_ship_ids = {order.ship_id for order in orders}
+
+    if not order_ship_ids.issubset(player_ships):
+        invalid_ships = order_ship_ids - player_ships
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid ship IDs for {side}: {invalid_ships}",
+        )
+
+    # Validate that all player's ships have orders
+    if order_ship_ids != player_ships:
+        missing_ships = player_ships - order_ship_ids
+        raise HTTPException(
+            status_code=400,
+            detail=f"Missing orders for ships: {missing_ships}",
+        )
+
+
 class SubmitOrdersRequest(BaseModel):
     """Request to submit movement orders for a turn."""
 
@@ -197,7 +335,7 @@ class SubmitOrdersResponse(BaseModel):
 
 @router.post("/{game_id}/turns/{turn}/orders", response_model=SubmitOrdersResponse)
 async def submit_orders(
-    game_id: str, turn: int, request: SubmitOrdersRequest
+    game_id: str, turn: int, request: SubmitOrdersRequest, include_log: bool = True
 ) -> SubmitOrdersResponse:
     """Submit movement orders for a player's ships.
 
@@ -205,6 +343,7 @@ async def submit_orders(
         game_id: The game identifier
         turn: The turn number
         request: Orders submission request
+        include_log: Whether the returned state includes the full event log
 
     Returns:
         Updated game state with orders recorded
@@ -232,24 +371,7 @@ async def submit_orders(
             detail=f"Cannot submit orders in phase {game.phase.value}",
         )
 
-    # Validate that all orders are for ships belonging to this player
-    player_ships = {ship.id for ship in game.get_ships_by_side(request.side)}
-    order_ship_ids = {order.ship_id for order in request.orders}
-
-    if not order_ship_ids.issubset(player_ships):
-        invalid_ships = order_ship_ids - player_ships
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid ship IDs for {request.side}: {invalid_ships}",
-        )
-
-    # Validate that all player's ships have orders
-    if order_ship_ids != player_ships:
-        missing_ships = player_ships - order_ship_ids
-        raise HTTPException(
-            status_code=400,
-            detail=f"Missing orders for ships: {missing_ships}",
-        )
+    _validate_side_orders(game, request.side, request.orders)
 
     # Create TurnOrders
     turn_orders = TurnOrders(
@@ -268,7 +390,71 @@ async def submit_orders(
     # Update game in store
     store.update_game(game)
 
-    return SubmitOrdersResponse(state=game, orders_submitted=True)
+    return SubmitOrdersResponse(state=_response_state(game, include_log), orders_submitted=True)
+
+
+class SubmitAllOrdersRequest(BaseModel):
+    """Request to submit both players' movement orders for a turn at once."""
+
+    p1_orders: list[ShipOrders] = Field(description="Orders for each P1 ship")
+    p2_orders: list[ShipOrders] = Field(description="Orders for each P2 ship")
+
+
+@router.post("/{game_id}/turns/{turn}/orders/batch", response_model=SubmitOrdersResponse)
+async def submit_all_orders(
+    game_id: str, turn: int, request: SubmitAllOrdersRequest, include_log: bool = True
+) -> SubmitOrdersResponse:
+    """Submit movement orders for both players in one request.
+
+    Both sides are validated before either is recorded, so a rejected request
+    leaves the game unchanged.
+
+    Args:
+        game_id: The game identifier
+        turn: The turn number
+        request: Orders for both sides
+        include_log: Whether the returned state includes the full event log
+
+    Returns:
+        Updated game state with both sides' orders recorded
+
+    Raises:
+        HTTPException: If game not found, turn mismatch, invalid phase, or invalid orders
+    """
+    store = get_game_store()
+    game = store.get_game(game_id)
+
+    if game is None:
+        raise HTTPException(status_code=404, detail=f"Game '{game_id}' not found")
+
+    # Validate turn number
+    if turn != game.turn_number:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Turn mismatch: expected {game.turn_number}, got {turn}",
+        )
+
+    # Validate phase
+    if game.phase != GamePhase.PLANNING:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot submit orders in phase {game.phase.value}",
+        )
+
+    _validate_side_orders(game, "P1", request.p1_orders)
+    _validate_side_orders(game, "P2", request.p2_orders)
+
+    game.p1_orders = TurnOrders(
+        turn_number=turn, side="P1", orders=request.p1_orders, submitted=True
+    )
+    game.p2_orders = TurnOrders(
+        turn_number=turn, side="P2", orders=request.p2_orders, submitted=True
+    )
+
+    # Update game in store
+    store.update_game(game)
+
+    return SubmitOrdersResponse(state=_response_state(game, include_log), orders_submitted=True)
 
 
 class MarkReadyRequest(BaseModel):
@@ -286,7 +472,9 @@ class MarkReadyResponse(BaseModel):
 
 
 @router.post("/{game_id}/turns/{turn}/ready", response_model=MarkReadyResponse)
-async def mark_ready(game_id: str, turn: int, request: MarkReadyRequest) -> MarkReadyResponse:
+async def mark_ready(
+    game_id: str, turn: int, request: MarkReadyRequest, include_log: bool = True
+) -> MarkReadyResponse:
     """Mark a player as ready to proceed.
 
     When both players are ready, orders are revealed.
@@ -295,6 +483,7 @@ async def mark_ready(game_id: str, turn: int, request: MarkReadyRequest) -> Mark
         game_id: The game identifier
         turn: The turn number
         request: Ready request
+        include_log: Whether the returned state includes the full event log
 
     Returns:
         Updated game state with ready status
@@ -344,7 +533,9 @@ async def mark_ready(game_id: str, turn: int, request: MarkReadyRequest) -> Mark
     # Update game in store
     store.update_game(game)
 
-    return MarkReadyResponse(state=game, ready=True, both_ready=both_ready)
+    return MarkReadyResponse(
+        state=_response_state(game, include_log), ready=True, both_ready=both_ready
+    )
 
 
 class ResolveMovementResponse(BaseModel):
@@ -355,7 +546,9 @@ class ResolveMovementResponse(BaseModel):
 
 
 @router.post("/{game_id}/turns/{turn}/resolve/movement", response_model=ResolveMovementResponse)
-async def resolve_movement(game_id: str, turn: int) -> ResolveMovementResponse:
+async def resolve_movement(
+    game_id: str, turn: int, include_log: bool = True
+) -> ResolveMovementResponse:
     """Resolve simultaneous movement for all ships.
 
     This endpoint executes the movement phase including:
@@ -369,6 +562,7 @@ async def resolve_movement(game_id: str, turn: int) -> ResolveMovementResponse:
     Args:
         game_id: The game identifier
         turn: The turn number
+        include_log: Whether the returned state includes the full event log
 
     Returns:
         Updated game state with new ship positions and movement events
@@ -406,8 +600,8 @@ async def resolve_movement(game_id: str, turn: int) -> ResolveMovementResponse:
     # Collect all movement events
     all_events: list[EventLogEntry] = []
 
-    # Create RNG for this resolution (unseeded for normal play)
-    rng = create_rng()
+    # Create RNG for this resolution (unseeded unless the game has a seed)
+    rng = _game_rng(game)
 
     # Parse movement orders for all ships
     parsed_movements = {}
@@ -498,7 +692,7 @@ async def resolve_movement(game_id: str, turn: int) -> ResolveMovementResponse:
     # Update game in store
     store.update_game(game)
 
-    return ResolveMovementResponse(state=game, events=all_events)
+    return ResolveMovementResponse(state=_response_state(game, include_log), events=all_events)
 
 
 class FireBroadsideRequest(BaseModel):
@@ -519,7 +713,7 @@ class FireBroadsideResponse(BaseModel):
 
 @router.post("/{game_id}/turns/{turn}/combat/fire", response_model=FireBroadsideResponse)
 async def fire_broadside(
-    game_id: str, turn: int, request: FireBroadsideRequest
+    game_id: str, turn: int, request: FireBroadsideRequest, include_log: bool = True
 ) -> FireBroadsideResponse:
     """Fire a ship's broadside at a target.
 
@@ -535,6 +729,7 @@ async def fire_broadside(
         game_id: The game identifier
         turn: The turn number
         request: Firing request with ship, broadside, target, and aim
+        include_log: Whether the returned state includes the full event log
 
     Returns:
         Updated game state with damage applied and combat events
@@ -632,7 +827,7 @@ async def fire_broadside(
         initial_crew = firing_ship.crew
 
     # Create RNG and hit tables
-    rng = create_rng()
+    rng = _game_rng(game)
     hit_tables = HitTables()
 
     # Resolve the broadside firing
@@ -692,6 +887,7 @@ async def fire_broadside(
 
     # Update game state
     game.event_log.append(event)
+    events = [event]
 
     # Check victory condition after combat
     victory_result = check_victory_condition(game)
@@ -700,11 +896,12 @@ async def fire_broadside(
         game.winner = victory_result.winner
         victory_event = create_victory_event(victory_result, turn, game.phase)
         game.event_log.append(victory_event)
+        events.append(victory_event)
 
     # Update game in store
     store.update_game(game)
 
-    return FireBroadsideResponse(state=game, events=[event])
+    return FireBroadsideResponse(state=_response_state(game, include_log), events=events)
 
 
 class BroadsideArcRequest(BaseModel):
@@ -772,19 +969,76 @@ async def get_broadside_arc_info(
 
     broadside_enum = Broadside.L if broadside == "L" else Broadside.R
 
+    return _broadside_arc_info(ship, list(game.ships.values()), broadside_enum)
+
+
+class AllBroadsideArcsResponse(BaseModel):
+    """Response with arc and targeting information for every ship's broadsides."""
+
+    arcs: dict[str, dict[str, BroadsideArcResponse]] = Field(
+        description="Arc info keyed by ship ID, then by broadside (L or R)"
+    )
+
+
+@router.get("/{game_id}/broadsides/arcs", response_model=AllBroadsideArcsResponse)
+async def get_all_broadside_arcs(game_id: str) -> AllBroadsideArcsResponse:
+    """Get arc hexes and valid targets for both broadsides of every ship.
+
+    Batched form of the per-broadside arc endpoint, so clients that need the
+    whole picture make one request instead of two per ship.
+
+    Args:
+        game_id: The game identifier
+
+    Returns:
+        Arc info for each ship's L and R broadsides
+
+    Raises:
+        HTTPException: If game not found
+    """
+    store = get_game_store()
+    game = store.get_game(game_id)
+
+    if game is None:
+        raise HTTPException(status_code=404, detail=f"Game '{game_id}' not found")
+
+    all_ships = list(game.ships.values())
+    return AllBroadsideArcsResponse(
+        arcs={
+            ship.id: {
+                broadside.value: _broadside_arc_info(ship, all_ships, broadside)
+                for broadside in (Broadside.L, Broadside.R)
+            }
+            for ship in all_ships
+        }
+    )
+
+
+def _broadside_arc_info(
+    ship: Ship, all_ships: list[Ship], broadside: Broadside
+) -> BroadsideArcResponse:
+    """Calculate arc hexes, ships in arc and valid targets for one broadside.
+
+    Args:
+        ship: The ship whose broadside arc to calculate
+        all_ships: All ships in the game
+        broadside: Which broadside
+
+    Returns:
+        Arc hexes, ships in arc, valid targets and closest enemy distance
+    """
     # Get arc hexes
-    arc_hexes_set = get_broadside_arc_hexes(ship, broadside_enum, max_range=10)
+    arc_hexes_set = get_broadside_arc_hexes(ship, broadside, max_range=10)
     arc_hexes_list: list[tuple[int, int]] = [
         (hex_coord.col, hex_coord.row) for hex_coord in arc_hexes_set
     ]
 
     # Get ships in arc
-    all_ships = list(game.ships.values())
-    ships_in_arc_info = get_ships_in_arc(ship, all_ships, broadside_enum, max_range=10)
+    ships_in_arc_info = get_ships_in_arc(ship, all_ships, broadside, max_range=10)
     ships_in_arc_ids = [target_info.ship.id for target_info in ships_in_arc_info]
 
     # Get valid targets (enforcing closest-target rule)
-    valid_targets_ships = get_all_valid_targets(ship, all_ships, broadside_enum, max_range=10)
+    valid_targets_ships = get_all_valid_targets(ship, all_ships, broadside, max_range=10)
     valid_target_ids = [target.id for target in valid_targets_ships]
 
     # Calculate closest distance for display
@@ -815,7 +1069,9 @@ class ResolveReloadResponse(BaseModel):
 
 
 @router.post("/{game_id}/turns/{turn}/resolve/reload", response_model=ResolveReloadResponse)
-async def resolve_reload(game_id: str, turn: int) -> ResolveReloadResponse:
+async def resolve_reload(
+    game_id: str, turn: int, include_log: bool = True
+) -> ResolveReloadResponse:
     """Reload all fired broadsides.
 
     This endpoint implements the reload phase:
@@ -827,6 +1083,7 @@ async def resolve_reload(game_id: str, turn: int) -> ResolveReloadResponse:
     Args:
         game_id: The game identifier
         turn: The turn number
+        include_log: Whether the returned state includes the full event log
 
     Returns:
         Updated game state with reloaded broadsides and reload events
@@ -881,7 +1138,7 @@ async def resolve_reload(game_id: str, turn: int) -> ResolveReloadResponse:
     # Update game in store
     store.update_game(game)
 
-    return ResolveReloadResponse(state=game, events=reload_events)
+    return ResolveReloadResponse(state=_response_state(game, include_log), events=reload_events)
 
 
 class AdvanceTurnResponse(BaseModel):
@@ -891,7 +1148,7 @@ class AdvanceTurnResponse(BaseModel):
 
 
 @router.post("/{game_id}/turns/{turn}/advance", response_model=AdvanceTurnResponse)
-async def advance_turn(game_id: str, turn: int) -> AdvanceTurnResponse:
+async def advance_turn(game_id: str, turn: int, include_log: bool = True) -> AdvanceTurnResponse:
     """Advance to the next turn.
 
     This endpoint implements turn advancement:
@@ -904,6 +1161,7 @@ async def advance_turn(game_id: str, turn: int) -> AdvanceTurnResponse:
     Args:
         game_id: The game identifier
         turn: The current turn number to advance from
+        include_log: Whether the returned state includes the full event log
 
     Returns:
         Updated game state in planning phase for new turn
@@ -951,4 +1209,4 @@ async def advance_turn(game_id: str, turn: int) -> AdvanceTurnResponse:
     # Update game in store
     store.update_game(game)
 
-    return AdvanceTurnResponse(state=game)
+    return AdvanceTurnResponse(state=_response_state(game, include_log))
@@ -67,6 +67,13 @@ class GameStore:
             raise ValueError(f"Game with id {game_id} not found")
         del self._games[game_id]
 
+    def clear(self) -> None:
+        """Delete all games.
+
+        Replaces the backing dict in one step rather than deleting games one by one.
+        """
+        self._games = {}
+
     def list_games(self) -> list[Game]:
         """List all games.
 
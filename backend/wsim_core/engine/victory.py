@@ -40,13 +40,12 @@ def check_first_struck(game: Game) -> VictoryResult:
     Returns:
         VictoryResult indicating if game ended and who won
     """
-    struck_ships = [ship for ship in game.ships.values() if ship.struck]
+    # Find which side struck first (stop at the first struck ship)
+    struck_ship = next((ship for ship in game.ships.values() if ship.struck), None)
 
-    if not struck_ships:
+    if struck_ship is None:
         return VictoryResult(game_ended=False)
 
-    # Find which side struck first
-    struck_ship = struck_ships[0]
     winner = "P2" if struck_ship.side == "P1" else "P1"
 
     return VictoryResult(
@@ -45,6 +45,11 @@ class Game(BaseModel):
     game_ended: bool = Field(default=False, description="Whether the game has ended")
     winner: str | None = Field(default=None, description="Winner side (P1, P2, or None for draw)")
 
+    # Dice
+    rng_seed: int | None = Field(
+        default=None, description="Seed for reproducible dice rolls (None = unseeded)"
+    )
+
     def get_ship(self, ship_id: str) -> Ship:
         """Get a ship by ID.
 
@@ -70,6 +75,20 @@ class Game(BaseModel):
         """
         return [ship for ship in self.ships.values() if ship.side == side]
 
+    def fork(self, game_id: str) -> "Game":
+        """Create an independent copy of this game under a new ID.
+
+        Ships, orders and the event log are deep-copied, so play on the fork
+        never affects the original.
+
+        Args:
+            game_id: Identifier for the forked game
+
+        Returns:
+            The forked game
+        """
+        return self.model_copy(deep=True, update={"id": game_id})
+
     def add_event(self, event: EventLogEntry) -> None:
         """Add an event to the log.
 
@@ -1,10 +1,16 @@
 """Hex coordinate models."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class HexCoord(BaseModel):
-    """Hex coordinate (col, row)."""
+    """Hex coordinate (col, row).
+
+    Coordinates are immutable so they stay consistent with their hash when used
+    as dict keys or set members.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     col: int = Field(ge=0, description="Column (x-axis)")
     row: int = Field(ge=0, description="Row (y-axis)")
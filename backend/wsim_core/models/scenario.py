@@ -1,5 +1,7 @@
 """Scenario definition models for loading scenarios from JSON."""
 
+from collections import Counter
+
 from pydantic import BaseModel, Field
 
 from .common import Facing, LoadState, Side, WindDirection
@@ -95,8 +97,8 @@ class Scenario(BaseModel):
         """
         ship_ids = [ship.id for ship in self.ships]
         if len(ship_ids) != len(set(ship_ids)):
-            duplicates = [sid for sid in ship_ids if ship_ids.count(sid) > 1]
-            raise ValueError(f"Duplicate ship IDs found: {set(duplicates)}")
+            duplicates = {sid for sid, count in Counter(ship_ids).items() if count > 1}
+            raise ValueError(f"Duplicate ship IDs found: {duplicates}")
 
     def validate_ships_in_bounds(self) -> None:
         """Validate that all ships start within map bounds.
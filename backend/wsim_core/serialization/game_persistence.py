@@ -7,9 +7,12 @@ Useful for:
 - Game replay and analysis
 """
 
-import json
+import os
+from collections.abc import Iterator
 from pathlib import Path
 
+import orjson
+
 from wsim_core.models.game import Game
 
 
@@ -46,8 +49,8 @@ class GamePersistence:
         # Use Pydantic's model_dump with explicit JSON-serializable mode
         game_data = game.model_dump(mode="json")
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(game_data, f, indent=2, ensure_ascii=False)
+        # orjson writes UTF-8 directly; keep the indented layout for manual inspection
+        file_path.write_bytes(orjson.dumps(game_data, option=orjson.OPT_INDENT_2))
 
         return file_path
 
@@ -69,11 +72,9 @@ class GamePersistence:
         if not file_path.exists():
             raise FileNotFoundError(f"Game file not found: {file_path}")
 
-        with open(file_path, encoding="utf-8") as f:
-            game_data = json.load(f)
-
-        # Pydantic will validate and parse the JSON data
-        return Game.model_validate(game_data)
+        # Parse and validate in one pass, without building an intermediate dict.
+        # Malformed JSON raises ValidationError, a ValueError subclass.
+        return Game.model_validate_json(file_path.read_bytes())
 
     def delete_saved_game(self, game_id: str) -> None:
         """Delete a saved game file.
@@ -97,8 +98,7 @@ class GamePersistence:
         Returns:
             List of game IDs that have saved files
         """
-        game_files = self.save_directory.glob("*.json")
-        return [f.stem for f in game_files if f.is_file()]
+        return [entry.name.removesuffix(".json") for entry in self._saved_game_entries()]
 
     def game_exists(self, game_id: str) -> bool:
         """Check if a saved game file exists.
@@ -139,12 +139,12 @@ class GamePersistence:
         Raises:
             ValueError: If any game file is invalid
         """
-        game_ids = self.list_saved_games()
-        games = []
-        for game_id in game_ids:
-            game = self.load_game(game_id)
-            games.append(game)
-        return games
+        # Read each file straight from the directory scan; unlike load_game this
+        # skips rebuilding the path and re-checking that the file exists.
+        return [
+            Game.model_validate_json(Path(entry.path).read_bytes())
+            for entry in self._saved_game_entries()
+        ]
 
     def clear_all_saved_games(self) -> int:
         """Delete all saved game files.
@@ -152,10 +152,22 @@ class GamePersistence:
         Returns:
             Number of files deleted
         """
-        game_files = list(self.save_directory.glob("*.json"))
         count = 0
-        for file_path in game_files:
-            if file_path.is_file():
-                file_path.unlink()
-                count += 1
+        for entry in list(self._saved_game_entries()):
+            os.unlink(entry.path)
+            count += 1
         return count
+
+    def _saved_game_entries(self) -> Iterator[os.DirEntry[str]]:
+        """Yield directory entries for the saved game files.
+
+        ``os.scandir`` reports entry types from the directory listing itself, so
+        unlike ``Path.glob`` plus ``is_file`` this needs no extra stat per file.
+
+        Yields:
+            Entry for each regular ``*.json`` file in the save directory
+        """
+        with os.scandir(self.save_directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    yield entry
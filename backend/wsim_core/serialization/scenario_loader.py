@@ -1,15 +1,32 @@
 """Scenario loader for loading and validating scenario JSON files."""
 
-import json
+import os
+import stat
+from functools import lru_cache
 from pathlib import Path
 
 from pydantic import ValidationError
 
+from ..models.common import Facing
 from ..models.game import Game
 from ..models.hex import HexCoord
 from ..models.scenario import Scenario
 from ..models.ship import Ship
 
+# Offset from bow to stern for each facing (assuming offset coordinates).
+# The stern lies in the opposite direction of facing. Built once at import
+# rather than on every stern calculation.
+_STERN_OFFSETS: dict[Facing, tuple[int, int]] = {
+    Facing.N: (0, 1),  # Stern is to the South
+    Facing.NE: (-1, 1),  # Stern is to the Southwest
+    Facing.E: (-1, 0),  # Stern is to the West
+    Facing.SE: (-1, -1),  # Stern is to the Northwest
+    Facing.S: (0, -1),  # Stern is to the North
+    Facing.SW: (1, -1),  # Stern is to the Northeast
+    Facing.W: (1, 0),  # Stern is to the East
+    Facing.NW: (1, 1),  # Stern is to the Southeast
+}
+
 
 class ScenarioLoadError(Exception):
     """Raised when scenario loading fails."""
@@ -28,35 +45,94 @@ def load_scenario_from_file(file_path: Path | str) -> Scenario:
 
     Raises:
         ScenarioLoadError: If file doesn't exist, JSON is invalid, or validation fails
+
+    Note:
+        Parsed scenarios are cached per (path, mtime), so repeated loads of an
+        unchanged file skip JSON parsing and validation.
     """
     file_path = Path(file_path)
 
-    if not file_path.exists():
-        raise ScenarioLoadError(f"Scenario file not found: {file_path}")
+    # A single stat answers existence and file type and supplies the cache key.
+    try:
+        st = os.stat(file_path)
+    except (FileNotFoundError, NotADirectoryError) as e:
+        raise ScenarioLoadError(f"Scenario file not found: {file_path}") from e
+    except OSError as e:
+        raise ScenarioLoadError(f"Failed to read scenario file: {e}") from e
 
-    if not file_path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise ScenarioLoadError(f"Scenario path is not a file: {file_path}")
 
+    return _load_cached(str(file_path), st.st_mtime_ns)
+
+
+@lru_cache(maxsize=64)
+def _load_cached(file_path: str, mtime_ns: int) -> Scenario:
+    """Read and validate a scenario file, memoized on (path, mtime).
+
+    The modification time is part of the cache key so that editing a scenario
+    file on disk invalidates its cached entry. Failed loads raise and are not
+    cached. The returned Scenario is shared between callers and must not be
+    mutated.
+
+    Args:
+        file_path: Path to the scenario JSON file
+        mtime_ns: File modification time in nanoseconds (cache key only)
+
+    Returns:
+        Validated Scenario object
+
+    Raises:
+        ScenarioLoadError: If JSON is invalid or validation fails
+    """
     try:
-        with open(file_path) as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
-        raise ScenarioLoadError(f"Invalid JSON in scenario file: {e}") from e
+        with open(file_path, "rb") as f:
+            data = f.read()
     except OSError as e:
         raise ScenarioLoadError(f"Failed to read scenario file: {e}") from e
 
-    try:
-        scenario = Scenario.model_validate(data)
-    except ValidationError as e:
-        raise ScenarioLoadError(f"Scenario validation failed: {e}") from e
+    return _scenario_from_json(data, "file")
 
-    # Additional validations
+
+def load_scenario_from_bytes(data: bytes) -> Scenario:
+    """Load and validate a scenario from raw JSON bytes.
+
+    Parses straight into the Scenario model with pydantic's JSON validator,
+    skipping the intermediate Python dict.
+
+    Args:
+        data: Scenario JSON document
+
+    Returns:
+        Validated Scenario object
+
+    Raises:
+        ScenarioLoadError: If JSON is invalid or validation fails
+    """
+    return _scenario_from_json(data, "data")
+
+
+def _scenario_from_json(data: bytes, source: str) -> Scenario:
+    """Validate scenario JSON, naming its source in invalid-JSON errors.
+
+    Args:
+        data: Scenario JSON document
+        source: What the document came from ("file" or "data")
+
+    Returns:
+        Validated Scenario object
+
+    Raises:
+        ScenarioLoadError: If JSON is invalid or validation fails
+    """
     try:
-        scenario.validate_ship_ids_unique()
-        scenario.validate_ships_in_bounds()
-    except ValueError as e:
+        scenario = Scenario.model_validate_json(data)
+    except ValidationError as e:
+        if any(error["type"] == "json_invalid" for error in e.errors()):
+            raise ScenarioLoadError(f"Invalid JSON in scenario {source}: {e}") from e
         raise ScenarioLoadError(f"Scenario validation failed: {e}") from e
 
+    _validate_scenario_rules(scenario)
     return scenario
 
 
@@ -77,15 +153,25 @@ def load_scenario_from_dict(data: dict) -> Scenario:
     except ValidationError as e:
         raise ScenarioLoadError(f"Scenario validation failed: {e}") from e
 
-    # Additional validations
+    _validate_scenario_rules(scenario)
+    return scenario
+
+
+def _validate_scenario_rules(scenario: Scenario) -> None:
+    """Run the cross-field checks that the Scenario schema cannot express.
+
+    Args:
+        scenario: Schema-validated scenario
+
+    Raises:
+        ScenarioLoadError: If ship IDs are duplicated or ships start out of bounds
+    """
     try:
         scenario.validate_ship_ids_unique()
         scenario.validate_ships_in_bounds()
     except ValueError as e:
         raise ScenarioLoadError(f"Scenario validation failed: {e}") from e
 
-    return scenario
-
 
 def initialize_game_from_scenario(scenario: Scenario, game_id: str) -> Game:
     """Initialize a new game state from a scenario.
@@ -142,7 +228,7 @@ def initialize_game_from_scenario(scenario: Scenario, game_id: str) -> Game:
     )
 
 
-def _calculate_stern_hex(bow_hex: HexCoord, facing: str) -> HexCoord:
+def _calculate_stern_hex(bow_hex: HexCoord, facing: Facing) -> HexCoord:
     """Calculate stern hex position based on bow hex and facing.
 
     The stern is 1 hex behind the bow in the opposite direction of facing.
@@ -154,19 +240,5 @@ def _calculate_stern_hex(bow_hex: HexCoord, facing: str) -> HexCoord:
     Returns:
         The stern hex position
     """
-    # Offset map for hex directions (assuming offset coordinates)
-    # In a hex grid, each direction has a different offset
-    # We'll use the opposite direction from facing
-    offsets = {
-        "N": (0, 1),  # Stern is to the South
-        "NE": (-1, 1),  # Stern is to the Southwest
-        "E": (-1, 0),  # Stern is to the West
-        "SE": (-1, -1),  # Stern is to the Northwest
-        "S": (0, -1),  # Stern is to the North
-        "SW": (1, -1),  # Stern is to the Northeast
-        "W": (1, 0),  # Stern is to the East
-        "NW": (1, 1),  # Stern is to the Southeast
-    }
-
-    offset = offsets[facing]
-    return HexCoord(col=bow_hex.col + offset[0], row=bow_hex.row + offset[1])
+    dcol, drow = _STERN_OFFSETS[facing]
+    return HexCoord(col=bow_hex.col + dcol, row=bow_hex.row + drow)